@@ -0,0 +1,246 @@
+// Minimal DOM for running script.js under Node. It supports only what the
+// game screen uses and has no style or layout, so it measures script and
+// DOM mutation cost, not what a browser spends painting.
+const fs = require('fs');
+const path = require('path');
+
+let mutations = 0;
+const VOID_TAGS = new Set(['input', 'br', 'meta', 'link', 'img', 'hr']);
+
+class ShimNode {
+    constructor() {
+        this.parentNode = null;
+        this.childNodes = [];
+    }
+
+    get nextSibling() {
+        if (!this.parentNode) return null;
+        const siblings = this.parentNode.childNodes;
+        return siblings[siblings.indexOf(this) + 1] || null;
+    }
+
+    remove() {
+        if (this.parentNode) {
+            const siblings = this.parentNode.childNodes;
+            siblings.splice(siblings.indexOf(this), 1);
+            this.parentNode = null;
+            mutations++;
+        }
+    }
+}
+
+class ShimText extends ShimNode {
+    constructor(text) {
+        super();
+        this.data = text;
+    }
+
+    get textContent() {
+        return this.data;
+    }
+}
+
+class ShimClassList {
+    constructor(element) {
+        this.element = element;
+    }
+
+    names() {
+        return new Set((this.element.className || '').split(/\s+/).filter(Boolean));
+    }
+
+    write(names) {
+        this.element.className = [...names].join(' ');
+        mutations++;
+    }
+
+    add(...added) {
+        const names = this.names();
+        added.forEach(name => names.add(name));
+        this.write(names);
+    }
+
+    remove(...removed) {
+        const names = this.names();
+        removed.forEach(name => names.delete(name));
+        this.write(names);
+    }
+
+    contains(name) {
+        return this.names().has(name);
+    }
+
+    toggle(name, force) {
+        const names = this.names();
+        const has = names.has(name);
+        const want = force === undefined ? !has : !!force;
+        if (want !== has) {
+            want ? names.add(name) : names.delete(name);
+            this.write(names);
+        }
+        return want;
+    }
+}
+
+class ShimElement extends ShimNode {
+    constructor(tag) {
+        super();
+        this.tagName = tag.toUpperCase();
+        this.attributes = {};
+        this.className = '';
+        this.id = '';
+        this.style = {};
+        this.dataset = {};
+        this.classList = new ShimClassList(this);
+        this.listeners = {};
+    }
+
+    appendChild(node) {
+        return this.insertBefore(node, null);
+    }
+
+    insertBefore(node, reference) {
+        if (node.parentNode) {
+            const siblings = node.parentNode.childNodes;
+            siblings.splice(siblings.indexOf(node), 1);
+        }
+        const index = reference ? this.childNodes.indexOf(reference) : this.childNodes.length;
+        this.childNodes.splice(index, 0, node);
+        node.parentNode = this;
+        mutations++;
+        return node;
+    }
+
+    removeChild(node) {
+        node.remove();
+        return node;
+    }
+
+    get children() {
+        return this.childNodes.filter(node => node instanceof ShimElement);
+    }
+
+    get textContent() {
+        return this.childNodes.map(node => node.textContent).join('');
+    }
+
+    set textContent(text) {
+        this.clear();
+        if (text !== '') this.appendChild(new ShimText(String(text)));
+        mutations++;
+    }
+
+    set innerHTML(html) {
+        this.clear();
+        parseInto(this, html);
+        mutations++;
+    }
+
+    clear() {
+        this.childNodes.forEach(node => { node.parentNode = null; });
+        this.childNodes = [];
+    }
+
+    addEventListener(type, listener) {
+        (this.listeners[type] = this.listeners[type] || []).push(listener);
+    }
+
+    matches(selector) {
+        let match;
+        selector = selector.trim();
+        if (selector === '[data-key]') return this.dataset.key !== undefined;
+        if ((match = selector.match(/^#([\w-]+)$/))) return this.id === match[1];
+        if ((match = selector.match(/^\.([\w-]+)$/))) return this.classList.contains(match[1]);
+        if ((match = selector.match(/^(\w+)$/))) return this.tagName === match[1].toUpperCase();
+        throw new Error(`Unsupported selector ${selector}`);
+    }
+
+    descendants() {
+        const found = [];
+        const walk = node => node.children.forEach(child => {
+            found.push(child);
+            walk(child);
+        });
+        walk(this);
+        return found;
+    }
+
+    querySelectorAll(selector) {
+        const match = selector.trim().match(/^:scope\s*>\s*(.+)$/);
+        if (match) return this.children.filter(child => child.matches(match[1]));
+        return this.descendants().filter(element => element.matches(selector));
+    }
+
+    querySelector(selector) {
+        return this.querySelectorAll(selector)[0] || null;
+    }
+
+    get offsetHeight() {
+        return 0;
+    }
+}
+
+function parseInto(parent, html) {
+    const tokens = /<!--[\s\S]*?-->|<\/(\w+)\s*>|<(\w+)([^>]*?)\/?>|([^<]+)/g;
+    const stack = [parent];
+    let match;
+
+    while ((match = tokens.exec(html))) {
+        const top = stack[stack.length - 1];
+        if (match[0].startsWith('<!--')) continue;
+
+        if (match[1]) {
+            stack.pop();
+        } else if (match[2]) {
+            const element = new ShimElement(match[2]);
+            const attributes = /([\w-]+)(?:="([^"]*)")?/g;
+            let attribute;
+            while ((attribute = attributes.exec(match[3]))) {
+                const [, name, value = ''] = attribute;
+                if (name === 'class') element.className = value;
+                else if (name === 'id') element.id = value;
+                else if (name.startsWith('data-')) element.dataset[name.slice(5)] = value;
+                else element.attributes[name] = value;
+            }
+            top.childNodes.push(element);
+            element.parentNode = top;
+            if (!VOID_TAGS.has(match[2].toLowerCase()) && !match[0].endsWith('/>')) {
+                stack.push(element);
+            }
+        } else if (match[4] && match[4].trim()) {
+            const text = new ShimText(match[4]);
+            top.childNodes.push(text);
+            text.parentNode = top;
+        }
+    }
+}
+
+function installDom() {
+    const html = fs.readFileSync(path.join(__dirname, '../src/static/index.html'), 'utf8');
+    const body = new ShimElement('body');
+    parseInto(body, html.slice(html.indexOf('<body>') + 6, html.indexOf('</body>')));
+
+    const documentListeners = {};
+    global.window = global;
+    global.document = {
+        body,
+        hidden: false,
+        createElement: tag => new ShimElement(tag),
+        getElementById: id => body.descendants().find(element => element.id === id) || null,
+        querySelectorAll: selector => body.querySelectorAll(selector),
+        querySelector: selector => body.querySelector(selector),
+        addEventListener: (type, listener) => {
+            (documentListeners[type] = documentListeners[type] || []).push(listener);
+        }
+    };
+    // Polling is not part of the measurement
+    global.setTimeout = () => 0;
+    global.clearTimeout = () => {};
+
+    return {
+        ready: () => (documentListeners.DOMContentLoaded || []).forEach(listener => listener()),
+        mutations: () => mutations
+    };
+}
+
+module.exports = { installDom };
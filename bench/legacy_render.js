@@ -0,0 +1,271 @@
+// Rendering path used before incremental rendering, kept as the benchmark
+// baseline: every call rebuilds every section of the game screen with
+// innerHTML. It is evaluated inside the app frame, so it shares its globals.
+
+function legacyUpdateGameScreenNormal(game) {
+    // Track phase changes for phase result overlay
+    gameState.lastPhaseIndex = game.current_phase_index;
+    
+    // Update phase info
+    document.getElementById('current-phase').textContent = game.current_phase_index + 1;
+    document.getElementById('cards-in-phase').textContent = game.cards_in_current_phase;
+    document.getElementById('current-turn').textContent = game.current_turn + 1;
+    
+    // Update players status
+    legacyUpdatePlayersStatus(game);
+    
+    // Show appropriate game phase
+    legacyShowGamePhase(game);
+}
+
+function legacyUpdatePlayersStatus(game) {
+    const playersContainer = document.getElementById('players-info');
+    playersContainer.innerHTML = '';
+    
+    game.players.forEach(player => {
+        const playerDiv = document.createElement('div');
+        playerDiv.className = 'player-status';
+        
+        if (player.player_id === game.current_player_id) {
+            playerDiv.classList.add('current-player');
+        }
+        
+        if (player.is_eliminated) {
+            playerDiv.classList.add('eliminated');
+        }
+        
+        const guessText = player.guess !== null ? `Guess: ${player.guess}` : 'No guess';
+        const winsText = `Wins: ${player.turns_won}`;
+        
+        playerDiv.innerHTML = `
+            <div class="player-name">${player.name}</div>
+            <div class="player-lives">${'♥'.repeat(player.lives)}</div>
+            <div class="player-guess">${guessText}</div>
+            <div class="player-wins">${winsText}</div>
+        `;
+        
+        playersContainer.appendChild(playerDiv);
+    });
+}
+
+function legacyShowGamePhase(game) {
+    // Hide all phases
+    document.querySelectorAll('.game-phase').forEach(phase => {
+        phase.classList.remove('active');
+    });
+    
+    // Show appropriate phase
+    switch (game.phase) {
+        case 'guessing':
+            document.getElementById('guessing-phase').classList.add('active');
+            legacyUpdateGuessingPhase(game);
+            break;
+        case 'playing':
+            document.getElementById('playing-phase').classList.add('active');
+            legacyUpdatePlayingPhase(game);
+            break;
+        case 'phase_end':
+            document.getElementById('phase-end').classList.add('active');
+            legacyUpdatePhaseEnd(game);
+            break;
+        case 'game_over':
+            document.getElementById('game-over').classList.add('active');
+            legacyUpdateGameOver(game);
+            break;
+    }
+}
+
+function legacyUpdateGuessingPhase(game) {
+    const currentPlayer = game.players.find(p => p.player_id === gameState.playerId);
+    
+    // Show player's hand during guessing phase
+    legacyUpdatePlayerHandForGuessing(game);
+    
+    // Check if it's this player's turn to guess
+    const isMyTurnToGuess = game.current_guessing_player_id === gameState.playerId;
+    
+    if (currentPlayer && currentPlayer.guess === null && isMyTurnToGuess) {
+        // Show guess buttons with constraints
+        const guessContainer = document.getElementById('guess-buttons');
+        guessContainer.innerHTML = '';
+        
+        // Use valid guesses from backend
+        const validGuesses = game.valid_guesses || [];
+        
+        if (validGuesses.length > 0) {
+            validGuesses.forEach(guess => {
+                const button = document.createElement('button');
+                button.className = 'guess-btn';
+                button.textContent = guess;
+                button.addEventListener('click', () => makeGuess(guess));
+                guessContainer.appendChild(button);
+            });
+        } else {
+            guessContainer.innerHTML = '<p>No valid guesses available</p>';
+        }
+    } else if (currentPlayer && currentPlayer.guess !== null) {
+        // Player has already guessed
+        document.getElementById('guess-buttons').innerHTML = '<p>You have made your guess. Waiting for other players...</p>';
+    } else {
+        // Not this player's turn to guess
+        const currentGuessingPlayer = game.players.find(p => p.player_id === game.current_guessing_player_id);
+        const playerName = currentGuessingPlayer ? currentGuessingPlayer.name : 'Unknown';
+        document.getElementById('guess-buttons').innerHTML = `<p>Waiting for ${playerName} to make their guess...</p>`;
+    }
+    
+    // Show other players' guesses with turn order indication
+    legacyUpdateOtherGuessesWithOrder(game);
+}
+
+function legacyUpdateOtherGuessesWithOrder(game) {
+    const container = document.getElementById('other-guesses');
+    container.innerHTML = '<h4>Player Guesses (Anti-clockwise order):</h4>';
+    
+    game.players.forEach(player => {
+        const guessDiv = document.createElement('div');
+        guessDiv.className = 'guess-item';
+        
+        // Highlight current guessing player
+        if (player.player_id === game.current_guessing_player_id) {
+            guessDiv.classList.add('current-guesser');
+        }
+        
+        const guessText = player.guess !== null ? player.guess : '?';
+        const statusText = player.player_id === game.current_guessing_player_id ? ' (guessing now)' : '';
+        
+        guessDiv.innerHTML = `
+            <span>${player.name}${statusText}</span>
+            <span>${guessText}</span>
+        `;
+        
+        container.appendChild(guessDiv);
+    });
+}
+
+function legacyUpdatePlayerHandForGuessing(game) {
+    const currentPlayer = game.players.find(p => p.player_id === gameState.playerId);
+    if (!currentPlayer || !currentPlayer.hand) return;
+    
+    // Find or create hand display area in guessing phase
+    let handContainer = document.getElementById('guessing-hand-cards');
+    if (!handContainer) {
+        // Create hand display area if it doesn't exist
+        const guessingPhase = document.getElementById('guessing-phase');
+        const handSection = document.createElement('div');
+        handSection.className = 'guessing-hand-section';
+        handSection.innerHTML = `
+            <h4>Your Cards</h4>
+            <div id="guessing-hand-cards" class="hand-cards-display">
+                <!-- Player's cards will be shown here -->
+            </div>
+        `;
+        
+        // Insert before guess controls
+        const guessControls = guessingPhase.querySelector('.guess-controls');
+        guessingPhase.insertBefore(handSection, guessControls);
+        handContainer = document.getElementById('guessing-hand-cards');
+    }
+    
+    // Clear and populate hand
+    handContainer.innerHTML = '';
+    
+    currentPlayer.hand.forEach(card => {
+        const cardDiv = createCardElement(card, false);
+        cardDiv.classList.add('guessing-card');
+        handContainer.appendChild(cardDiv);
+    });
+}
+
+function legacyUpdatePlayingPhase(game) {
+    // Update current player info
+    const currentPlayerText = document.getElementById('current-player-text');
+    if (game.current_player_id === gameState.playerId) {
+        currentPlayerText.textContent = 'Your turn - Choose a card to play';
+    } else {
+        const currentPlayer = game.players.find(p => p.player_id === game.current_player_id);
+        currentPlayerText.textContent = `Waiting for ${currentPlayer ? currentPlayer.name : 'player'} to play`;
+    }
+    
+    // Update played cards
+    legacyUpdatePlayedCards(game);
+    
+    // Update player's hand
+    legacyUpdatePlayerHand(game);
+}
+
+function legacyUpdatePlayedCards(game) {
+    const container = document.getElementById('played-cards-area');
+    container.innerHTML = '';
+    
+    game.played_cards.forEach(playedCard => {
+        const cardDiv = createCardElement(playedCard.card, false);
+        cardDiv.classList.add('played-card');
+        
+        const player = game.players.find(p => p.player_id === playedCard.player_id);
+        const label = document.createElement('div');
+        label.className = 'player-label';
+        label.textContent = player ? player.name : 'Unknown';
+        cardDiv.appendChild(label);
+        
+        container.appendChild(cardDiv);
+    });
+}
+
+function legacyUpdatePlayerHand(game) {
+    const currentPlayer = game.players.find(p => p.player_id === gameState.playerId);
+    if (!currentPlayer) return;
+    
+    const container = document.getElementById('hand-cards');
+    container.innerHTML = '';
+    
+    const isMyTurn = game.current_player_id === gameState.playerId;
+    
+    currentPlayer.hand.forEach(card => {
+        const cardDiv = createCardElement(card, isMyTurn);
+        if (isMyTurn) {
+            cardDiv.classList.add('playable');
+            cardDiv.addEventListener('click', () => playCard(card.number, card.seed));
+        }
+        container.appendChild(cardDiv);
+    });
+}
+
+function legacyUpdatePhaseEnd(game) {
+    const container = document.getElementById('phase-results');
+    container.innerHTML = '<h4>Phase Results:</h4>';
+    
+    game.players.forEach(player => {
+        const resultDiv = document.createElement('div');
+        resultDiv.className = 'player-result';
+        
+        const success = player.guess === player.turns_won;
+        const resultText = success ? '✅ Correct!' : '❌ Wrong!';
+        
+        resultDiv.innerHTML = `
+            <div class="player-name">${player.name}</div>
+            <div>Guessed: ${player.guess}, Won: ${player.turns_won}</div>
+            <div class="result-status">${resultText}</div>
+            <div>Lives: ${player.lives}</div>
+        `;
+        
+        if (player.is_eliminated) {
+            resultDiv.innerHTML += '<div style="color: #ff6b6b; font-weight: bold;">ELIMINATED</div>';
+        }
+        
+        container.appendChild(resultDiv);
+    });
+}
+
+function legacyUpdateGameOver(game) {
+    const container = document.getElementById('game-results');
+    
+    if (game.winner) {
+        const winner = game.players.find(p => p.player_id === game.winner);
+        container.innerHTML = `
+            <h4>🎉 ${winner ? winner.name : 'Unknown'} Wins! 🎉</h4>
+            <p>Congratulations!</p>
+        `;
+    } else {
+        container.innerHTML = '<h4>Game Over</h4><p>No winner determined.</p>';
+    }
+}
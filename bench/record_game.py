@@ -0,0 +1,56 @@
+"""Record a full game as the sequence of states one client would poll.
+
+Players guess and play at random from a fixed seed. Every action is
+followed by a few identical polls, since a client polls more often than
+the state changes.
+
+    python bench/record_game.py --players 4 --seed 7 > bench/recorded_game.json
+"""
+import argparse
+import json
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models.game import Game, GamePhase
+
+
+def record_game(num_players, seed, polls_per_action):
+    random.seed(seed)
+    game = Game('recorded-game')
+    for i in range(num_players):
+        game.add_player(f'player-{i}', f'Player {i + 1}')
+    game.start_game()
+
+    viewer_id = game.players[0].player_id
+    polls = []
+
+    def poll():
+        state = game.to_dict(viewer_id)
+        polls.extend([state] * polls_per_action)
+
+    poll()
+    while game.phase != GamePhase.GAME_OVER:
+        if game.phase == GamePhase.GUESSING:
+            active_players = [p for p in game.players if not p.is_eliminated]
+            player = active_players[game.current_guessing_player]
+            game.make_guess(player.player_id, random.choice(game.get_valid_guesses(player.player_id)))
+        else:
+            player = game.get_current_player()
+            card = random.choice(player.hand)
+            game.play_card(player.player_id, card.number, card.seed.name)
+        poll()
+
+    return {'viewer_id': viewer_id, 'polls': polls}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--players', type=int, default=4)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--polls-per-action', type=int, default=3)
+    args = parser.parse_args()
+
+    json.dump(record_game(args.players, args.seed, args.polls_per_action), sys.stdout)
@@ -0,0 +1,68 @@
+// Replays recorded_game.json through the game screen under Node, like
+// render_benchmark.html does in a browser, using the minimal DOM from
+// dom_shim.js. Run from the repository root:
+//
+//     python bench/record_game.py > bench/recorded_game.json
+//     node bench/render_node_benchmark.js
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const { installDom } = require('./dom_shim');
+
+const RUNS = 20;
+
+const dom = installDom();
+const recording = JSON.parse(fs.readFileSync(path.join(__dirname, 'recorded_game.json'), 'utf8'));
+
+// Plain scripts share one global scope, so the legacy renderer and the
+// snippets below see the top-level declarations of script.js
+vm.runInThisContext(fs.readFileSync(path.join(__dirname, '../src/static/script.js'), 'utf8'));
+vm.runInThisContext(fs.readFileSync(path.join(__dirname, 'legacy_render.js'), 'utf8'));
+dom.ready();
+vm.runInThisContext(`gameState.playerId = ${JSON.stringify(recording.viewer_id)};`);
+showScreen('game-screen');
+
+function replay(mode) {
+    const frameTimes = [];
+    resetRenderCache();
+    const mutationsBefore = dom.mutations();
+
+    recording.polls.forEach(game => {
+        const start = process.hrtime.bigint();
+        if (mode === 'full') {
+            legacyUpdateGameScreenNormal(game);
+        } else if (hasStateChanged(game)) {
+            updateGameScreenNormal(game);
+        }
+        frameTimes.push(Number(process.hrtime.bigint() - start) / 1e6);
+    });
+
+    return { frameTimes, mutations: dom.mutations() - mutationsBefore };
+}
+
+function summarize(mode) {
+    const frameTimes = [];
+    let mutations = 0;
+    for (let run = 0; run < RUNS; run++) {
+        const result = replay(mode);
+        frameTimes.push(...result.frameTimes);
+        mutations = result.mutations;
+    }
+
+    const sorted = [...frameTimes].sort((a, b) => a - b);
+    const mean = frameTimes.reduce((sum, t) => sum + t, 0) / frameTimes.length;
+    return {
+        mean: mean.toFixed(3),
+        p95: sorted[Math.floor(sorted.length * 0.95)].toFixed(3),
+        mutations
+    };
+}
+
+console.log(`${recording.polls.length} polls, ${RUNS} runs per mode`);
+// Warm up both paths before measuring
+summarize('full');
+summarize('incremental');
+['full', 'incremental'].forEach(mode => {
+    const r = summarize(mode);
+    console.log(`${mode.padEnd(12)} mean ${r.mean} ms  p95 ${r.p95} ms  DOM mutations per game ${r.mutations}`);
+});
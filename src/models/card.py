@@ -89,4 +89,10 @@ class Deck:
     def reset(self):
         """Reset the deck to full 40 cards"""
         self._create_deck()
+    
+    def clone(self) -> 'Deck':
+        """Copy the deck, sharing the (immutable) cards"""
+        deck = Deck.__new__(Deck)
+        deck.cards = list(self.cards)
+        return deck
 
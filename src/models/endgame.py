@@ -0,0 +1,535 @@
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import time
+from src.models.card import Card, Seed
+from src.models.game import Game, GamePhase
+
+
+def card_index(card: Card) -> int:
+    """Index of a card in strength order: 0 is the weakest card, 39 the strongest"""
+    return (card.number - 1) * 4 + card.seed.value - 1
+
+
+def index_card(index: int) -> Card:
+    """Card for an index from card_index"""
+    return Card(index // 4 + 1, Seed(index % 4 + 1))
+
+
+class EndgamePosition(NamedTuple):
+    """A position inside a phase, seen with every hand open
+
+    Seats are the active players in playing order. `played` holds the cards
+    already played in the current turn, starting with the leader's.
+    """
+    hands: List[List[Card]]
+    leader: int
+    guesses: List[int]
+    turns_won: List[int]
+    played: Tuple[Card, ...] = ()
+
+    @classmethod
+    def from_game(cls, game: Game) -> 'EndgamePosition':
+        """Build the position of a game in its playing phase"""
+        if game.phase != GamePhase.PLAYING:
+            raise ValueError("Game is not in the playing phase")
+
+        active_players = [p for p in game.players if not p.is_eliminated]
+        return cls(
+            hands=[list(p.hand) for p in active_players],
+            leader=(game.current_player_index - len(game.played_cards)) % len(active_players),
+            guesses=[p.guess for p in active_players],
+            turns_won=[p.turns_won for p in active_players],
+            played=tuple(card for _, card in game.played_cards)
+        )
+
+
+class EndgameSolver:
+    """Endgame solver for the remaining turns of a phase
+
+    Every player is analysed on their own against all other players
+    together: a player "can make" their guess when some way of playing wins
+    exactly the guessed number of turns whatever the others do. A guess is
+    "reachable" when some way of playing by everyone reaches it.
+
+    Reachability is exact and has a closed form, from the start or the
+    middle of a turn. Making a guess against everybody else is searched
+    exactly with an AND/OR alpha-beta over bitmask hands, whose results at
+    turn boundaries go to a transposition table kept across calls. That
+    search grows too quickly for full 8-player phases, so each call gives it
+    `time_limit` seconds (no limit when None). What it leaves undecided is
+    answered by _ModelSearch, a turn-by-turn search against a simpler model
+    of the opponents, and reported with `exact` False.
+    """
+
+    def __init__(self, max_entries: int = 1_000_000, time_limit: Optional[float] = 0.01):
+        self.max_entries = max_entries
+        self.time_limit = time_limit
+        self.transpositions: Dict[Tuple, bool] = {}
+
+    def solve(self, position: EndgamePosition) -> List[Dict]:
+        """Analyse the position for every player"""
+        deadline = self._deadline()
+        players = len(position.hands)
+        to_move = (position.leader + len(position.played)) % players
+
+        results = []
+        for seat in range(players):
+            # Every seat gets a fair share of the exact search time; the
+            # best card gets a share too
+            can_make, exact = self._can_make(position, seat, _share(deadline, players - seat + 1))
+            results.append({
+                'seat': seat,
+                'can_make_guess': can_make,
+                'exact': exact,
+                'can_reach_guess': self.can_reach_guess(position, seat)
+            })
+
+        best_card = self._best_card(position, deadline)
+        for result in results:
+            result['best_card'] = best_card if result['seat'] == to_move else None
+        return results
+
+    def can_make_guess(self, position: EndgamePosition, seat: int) -> bool:
+        """Check if a player can make their guess against any play by the others
+
+        Falls back to the opponent model when the exact search runs out of
+        time; use solve() to know which answers are exact.
+        """
+        return self._can_make(position, seat, self._deadline())[0]
+
+    def can_reach_guess(self, position: EndgamePosition, seat: int) -> bool:
+        """Check if a player's guess can still be reached by some play of all players"""
+        hands = [_to_mask(hand) for hand in position.hands]
+        need = position.guesses[seat] - position.turns_won[seat]
+        return _reachable_in_turn(hands, seat, need, _played_seats(position))
+
+    def best_card(self, position: EndgamePosition) -> Optional[Card]:
+        """Best card for the player to move
+
+        Prefers a card that makes the guess against any play by the others
+        (exactly, then by the opponent model), then one that keeps it
+        reachable, then the weakest card.
+        """
+        return self._best_card(position, self._deadline())
+
+    def _best_card(self, position: EndgamePosition, deadline: Optional[float]) -> Optional[Card]:
+        seat = (position.leader + len(position.played)) % len(position.hands)
+        hand = position.hands[seat]
+        if not hand:
+            return None
+
+        children = []
+        for card in sorted(hand, key=card_index, reverse=True):
+            hands = list(position.hands)
+            hands[seat] = [c for c in hand if c != card]
+            children.append((card, position._replace(hands=hands, played=position.played + (card,))))
+
+        undecided = []
+        for index, (card, child) in enumerate(children):
+            value = self._search(child, seat, _share(deadline, len(children) - index))
+            if value:
+                return card
+            if value is None:
+                undecided.append((card, child))
+
+        for card, child in undecided:
+            if self._model(child, seat):
+                return card
+
+        for card, child in children:
+            if self.can_reach_guess(child, seat):
+                return card
+
+        return min(hand, key=card_index)
+
+    def _can_make(self, position: EndgamePosition, seat: int,
+                  deadline: Optional[float]) -> Tuple[bool, bool]:
+        """Whether the seat can make its guess, and whether that answer is exact"""
+        value = self._search(position, seat, deadline)
+        if value is not None:
+            return value, True
+        return self._model(position, seat), False
+
+    def _deadline(self) -> Optional[float]:
+        if self.time_limit is None:
+            return None
+        return time.perf_counter() + self.time_limit
+
+    def _search(self, position: EndgamePosition, seat: int,
+                deadline: Optional[float]) -> Optional[bool]:
+        """Exact answer for one seat, or None when the deadline passes first"""
+        hands = [_to_mask(hand) for hand in position.hands]
+        need = position.guesses[seat] - position.turns_won[seat]
+        search = _Search(self, seat, deadline)
+
+        best, best_seat = -1, -1
+        for offset, card in enumerate(position.played):
+            if card_index(card) > best:
+                best, best_seat = card_index(card), (position.leader + offset) % len(hands)
+
+        if len(self.transpositions) > self.max_entries:
+            self.transpositions.clear()
+
+        try:
+            if not position.played:
+                return search.turn(hands, position.leader, need)
+            return search.play(hands, position.leader, len(position.played), best, best_seat, need)
+        except _OutOfTime:
+            return None
+
+    def _model(self, position: EndgamePosition, seat: int) -> bool:
+        """Answer for one seat against the opponent model of _ModelSearch"""
+        hands = [_to_mask(hand) for hand in position.hands]
+        need = position.guesses[seat] - position.turns_won[seat]
+        played = _played_seats(position)
+        search = _ModelSearch(self, seat)
+
+        if not played:
+            return search.turn(hands, need)
+
+        others_best = max((card for s, card in played.items() if s != seat), default=-1)
+        waiting = [s for s in range(len(hands)) if s != seat and s not in played]
+        if seat in played:
+            return search.trick(hands, need, played[seat], others_best, waiting)
+
+        own = hands[seat]
+        for card in _cards(own):
+            hands[seat] = own & ~(1 << card)
+            if search.trick(hands, need, card, others_best, waiting):
+                return True
+        return False
+
+
+class _OutOfTime(Exception):
+    pass
+
+
+class _Search:
+    """One exact search for one player's guess; shares the solver's transposition table"""
+
+    CLOCK_INTERVAL = 256  # Positions visited between looks at the clock
+
+    def __init__(self, solver: EndgameSolver, seat: int, deadline: Optional[float]):
+        self.table = solver.transpositions
+        self.seat = seat
+        self.deadline = deadline
+        self.nodes = 0
+
+    def turn(self, hands: List[int], leader: int, need: int) -> bool:
+        """Value of the position at the start of a turn"""
+        key = ('exact', self.seat, need, leader, tuple(hands))
+        value = self.table.get(key)
+        if value is None:
+            value = _bound(hands, self.seat, need)
+            if value is None:
+                value = self.play(hands, leader, 0, -1, -1, need)
+            self.table[key] = value
+        return value
+
+    def play(self, hands: List[int], leader: int, played: int, best: int, best_seat: int,
+             need: int) -> bool:
+        """Value of the position with `played` cards already in the current turn"""
+        self.nodes += 1
+        if (self.deadline is not None and self.nodes % self.CLOCK_INTERVAL == 0
+                and time.perf_counter() > self.deadline):
+            raise _OutOfTime()
+
+        players = len(hands)
+        if played == players:
+            return self.turn(hands, best_seat, need - (best_seat == self.seat))
+
+        seat = (leader + played) % players
+        hand = hands[seat]
+        deciding = seat == self.seat
+
+        live = 0
+        for h in hands:
+            live |= h
+        if best >= 0:
+            live |= 1 << best
+
+        # Try high cards first while the player still needs turns: they
+        # win them for the player and take them away for the opponents
+        for card in _distinct_cards(hand, live, descending=need > 0):
+            hands[seat] = hand & ~(1 << card)
+            if card > best:
+                value = self.play(hands, leader, played + 1, card, seat, need)
+            else:
+                value = self.play(hands, leader, played + 1, best, best_seat, need)
+            hands[seat] = hand
+
+            if value == deciding:
+                return value
+
+        return not deciding
+
+
+class _ModelSearch:
+    """Search for one player's guess against a simpler model of the opponents
+
+    In every turn the player plays first and the opponents, seeing that
+    card, decide together only whether the player wins the turn. Who wins
+    among them does not matter, so turn order is ignored. Each opponent
+    plays its strongest card under the player's, which keeps both its
+    highest and its lowest cards for later. To take a turn, the opponent
+    with the weakest card over the player's plays that card, and one with
+    nothing under it plays its weakest card. Only turn outcomes branch, so
+    a full 8-player phase takes milliseconds.
+
+    The model sees the player's card before every opponent plays, but also
+    ties each opponent to one card per outcome, so its answer can differ
+    from the exact one either way. The bounds shared with the exact search
+    still apply at every turn.
+    """
+
+    def __init__(self, solver: EndgameSolver, seat: int):
+        self.table = solver.transpositions
+        self.seat = seat
+
+    def turn(self, hands: List[int], need: int) -> bool:
+        """Value of the position at the start of a turn"""
+        key = ('model', self.seat, need, tuple(hands))
+        value = self.table.get(key)
+        if value is None:
+            value = _bound(hands, self.seat, need)
+            if value is None:
+                value = self._play_turn(hands, need)
+            self.table[key] = value
+        return value
+
+    def _play_turn(self, hands: List[int], need: int) -> bool:
+        own = hands[self.seat]
+        live = 0
+        for hand in hands:
+            live |= hand
+        waiting = [s for s in range(len(hands)) if s != self.seat]
+
+        for card in _distinct_cards(own, live, descending=need > 0):
+            hands[self.seat] = own & ~(1 << card)
+            value = self.trick(hands, need, card, -1, waiting)
+            hands[self.seat] = own
+            if value:
+                return True
+        return False
+
+    def trick(self, hands: List[int], need: int, own_card: int, others_best: int,
+              waiting: List[int]) -> bool:
+        """Value once the player's card is down, with `waiting` opponents still to play"""
+        outcomes = []
+        if others_best < own_card and all(hands[s] & ((1 << own_card) - 1) for s in waiting):
+            outcomes.append(True)
+        if others_best > own_card or any(hands[s] >> (own_card + 1) for s in waiting):
+            outcomes.append(False)
+
+        for wins in outcomes:
+            after = list(hands)
+            taker = None
+            if not wins and others_best < own_card:
+                # The cheapest card that takes the turn
+                taker = min((s for s in waiting if hands[s] >> (own_card + 1)),
+                            key=lambda s: _lowest_above(hands[s], own_card))
+                after[taker] &= ~(1 << _lowest_above(hands[taker], own_card))
+            for s in waiting:
+                if s != taker:
+                    under = hands[s] & ((1 << own_card) - 1)
+                    card = under.bit_length() - 1 if under else (hands[s] & -hands[s]).bit_length() - 1
+                    after[s] &= ~(1 << card)
+
+            if not self.turn(after, need - wins):
+                return False
+        return True
+
+
+def _to_mask(cards: List[Card]) -> int:
+    mask = 0
+    for card in cards:
+        mask |= 1 << card_index(card)
+    return mask
+
+
+def _cards(mask: int) -> List[int]:
+    """Card indices of a mask in ascending order"""
+    cards = []
+    while mask:
+        low = mask & -mask
+        cards.append(low.bit_length() - 1)
+        mask ^= low
+    return cards
+
+
+def _reachable(hands: List[int], seat: int, need: int) -> bool:
+    """Check if some play of all players gives the seat exactly `need` of the remaining turns
+
+    Swapping a winning card with a stronger losing one keeps both outcomes,
+    so the seat can win with its `need` strongest cards. Each opponent then
+    best spends its weakest cards under them, and the leftover opposing
+    cards must each top a different losing card.
+    """
+    own = _cards(hands[seat])
+    winners = own[len(own) - need:]
+    losers = own[:len(own) - need]
+
+    leftovers = []
+    for s, hand in enumerate(hands):
+        if s == seat:
+            continue
+        cards = _cards(hand)
+        if any(card > winner for card, winner in zip(cards, winners)):
+            return False
+        leftovers.extend(cards[need:])
+
+    leftovers.sort(reverse=True)
+    return all(card > loser for card, loser in zip(leftovers, reversed(losers)))
+
+
+def _reachable_in_turn(hands: List[int], seat: int, need: int, played: Dict[int, int]) -> bool:
+    """_reachable from the middle of a turn, with `played` mapping seats to their cards
+
+    Only the strongest card of the turn matters, so the seat tries each card
+    and each outcome of the turn. Every opponent still to play then spends
+    its weakest card that keeps the seat's winning cards on top of its hand,
+    which leaves it the strongest cards for the turns the seat must lose.
+    """
+    if not played:
+        return 0 <= need <= bin(hands[seat]).count('1') and _reachable(hands, seat, need)
+
+    others_best = max((card for s, card in played.items() if s != seat), default=-1)
+    waiting = [s for s in range(len(hands)) if s != seat and s not in played]
+    if seat in played:
+        choices = [(played[seat], hands[seat])]
+    else:
+        choices = [(card, hands[seat] & ~(1 << card)) for card in _cards(hands[seat])]
+
+    for own_card, own in choices:
+        for wins in (True, False):
+            if wins and others_best > own_card:
+                continue
+            rest = need - wins
+            if rest < 0 or rest > bin(own).count('1'):
+                continue
+            winners = _cards(own)[bin(own).count('1') - rest:]
+
+            limit = own_card if wins else 40
+            picks = {s: _spend(hands[s], winners, -1, limit) for s in waiting}
+            if any(card is None for card in picks.values()):
+                continue
+
+            options = [picks]
+            if not wins and others_best < own_card and all(card < own_card for card in picks.values()):
+                # Someone still to play has to take the turn
+                options = []
+                for taker in waiting:
+                    card = _spend(hands[taker], winners, own_card, 40)
+                    if card is not None:
+                        options.append({**picks, taker: card})
+
+            for option in options:
+                after = list(hands)
+                after[seat] = own
+                for s, card in option.items():
+                    after[s] &= ~(1 << card)
+                if _reachable(after, seat, rest):
+                    return True
+    return False
+
+
+def _spend(hand: int, winners: List[int], above: int, below: int) -> Optional[int]:
+    """Weakest card between `above` and `below` whose play keeps the hand under the winners"""
+    for card in _cards(hand):
+        if above < card < below:
+            left = _cards(hand & ~(1 << card))
+            if all(c < winner for c, winner in zip(left, winners)):
+                return card
+    return None
+
+
+def _bound(hands: List[int], seat: int, need: int) -> Optional[bool]:
+    """Value of a turn start settled without search against any play by the others, or None
+
+    Cards above every opposing card always win, cards below all of some
+    opponent's hand always lose, and the guess must stay reachable and beat
+    the opponents' fixed plays.
+    """
+    own = hands[seat]
+    turns_left = bin(own).count('1')
+    others = 0
+    lowest = 0
+    for s, hand in enumerate(hands):
+        if s != seat:
+            others |= hand
+            lowest = max(lowest, (hand & -hand).bit_length() - 1)
+    sure_wins = bin(own >> others.bit_length()).count('1')
+    sure_losses = bin(own & ((1 << lowest) - 1)).count('1')
+    if need < sure_wins or need > turns_left - sure_losses:
+        return False
+    if sure_wins + sure_losses == turns_left:
+        return True
+
+    if not _reachable(hands, seat, need) or not _beats_fixed_plays(hands, seat, need):
+        return False
+    return None
+
+
+def _beats_fixed_plays(hands: List[int], seat: int, need: int) -> bool:
+    """Check if the seat can win exactly `need` turns against both extreme fixed plays
+
+    If the opponents fix in advance which card each of them plays in every
+    turn, only the strongest opposing card of each turn matters and the seat
+    may order its own cards knowing them. Opponents all playing their cards
+    from weakest to strongest gives the weakest such cards; spreading the
+    strongest opposing cards over separate turns gives the strongest. When
+    either leaves the guess out of reach, the opponents win without ever
+    reacting to the seat's play.
+    """
+    own = _cards(hands[seat])
+    turns_left = len(own)
+    opposing = [_cards(hand) for s, hand in enumerate(hands) if s != seat]
+
+    aligned = [max(cards[turn] for cards in opposing) for turn in range(turns_left)]
+    spread = sorted(card for cards in opposing for card in cards)[-turns_left:]
+
+    for strongest in (aligned, spread):
+        # Win against the weakest turns with the strongest cards
+        winners = own[turns_left - need:]
+        losers = own[:turns_left - need]
+        if any(card < top for card, top in zip(winners, strongest[:need])):
+            return False
+        if any(card > top for card, top in zip(losers, strongest[need:])):
+            return False
+    return True
+
+
+def _lowest_above(hand: int, card: int) -> int:
+    """Weakest card of a hand stronger than `card`"""
+    above = hand >> (card + 1)
+    return (above & -above).bit_length() + card
+
+
+def _played_seats(position: EndgamePosition) -> Dict[int, int]:
+    """Seats that played in the current turn, with the indices of their cards"""
+    players = len(position.hands)
+    return {(position.leader + offset) % players: card_index(card)
+            for offset, card in enumerate(position.played)}
+
+
+def _distinct_cards(hand: int, live: int, descending: bool) -> List[int]:
+    """Cards of a hand, keeping one card per run of cards adjacent among the live ones"""
+    cards = []
+    while hand:
+        low = hand & -hand
+        card = low.bit_length() - 1
+        hand ^= low
+        above = live >> (card + 1)
+        # The next stronger live card is in the same hand: both play alike
+        if not (above and (hand >> (card + 1)) & (above & -above)):
+            cards.append(card)
+    if descending:
+        cards.reverse()
+    return cards
+
+
+def _share(deadline: Optional[float], parts: int) -> Optional[float]:
+    """Deadline for one of `parts` searches splitting the time left until `deadline`"""
+    if deadline is None:
+        return None
+    now = time.perf_counter()
+    return now + max(0.0, deadline - now) / parts
@@ -1,5 +1,6 @@
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, NamedTuple, Optional, Tuple
 from enum import Enum
+import threading
 import uuid
 from src.models.card import Card, Deck
 from src.models.player import Player
@@ -13,6 +14,13 @@ class GamePhase(Enum):
     GAME_OVER = "game_over"
 
 
+class Move(NamedTuple):
+    """A guess (card is None) or a card play (guess is None) by one player"""
+    player_id: str
+    guess: Optional[int] = None
+    card: Optional[Card] = None
+
+
 class Game:
     PHASE_SEQUENCE = [2, 3, 4, 5, 4, 3]  # Cards per phase sequence
     
@@ -26,13 +34,17 @@ class Game:
         self.phase = GamePhase.WAITING
         self.played_cards: List[Tuple[str, Card]] = []  # (player_id, card)
         self.turn_results: List[str] = []  # List of winning player_ids for each turn
+        self.phase_history: List[Dict[str, Tuple[int, int]]] = []  # Per finished phase: player_id -> (guess, turns_won)
         self.winner: Optional[str] = None
         self.max_players = 8
         self.min_players = 2
         self.guessing_order_start = 0  # Index of first player to guess in current phase
         self.current_guessing_player = 0  # Index of current player who should guess
+        self.version = 0  # Incremented on every state change
+        self._undo_stack: List[Tuple[Move, Tuple]] = []  # (move, undo record) per applied move
+        self.lock = threading.RLock()  # Held by requests while they read or change the game
     
-    def add_player(self, player_id: str, name: str) -> bool:
+    def add_player(self, player_id: str, name: str, user_id: Optional[int] = None) -> bool:
         """Add a player to the game"""
         if len(self.players) >= self.max_players:
             return False
@@ -40,8 +52,9 @@ class Game:
         if any(p.player_id == player_id for p in self.players):
             return False
         
-        player = Player(player_id, name)
+        player = Player(player_id, name, user_id)
         self.players.append(player)
+        self.version += 1
         return True
     
     def remove_player(self, player_id: str) -> bool:
@@ -49,6 +62,7 @@ class Game:
         for i, player in enumerate(self.players):
             if player.player_id == player_id:
                 self.players.pop(i)
+                self.version += 1
                 return True
         return False
     
@@ -98,6 +112,7 @@ class Game:
         self.current_guessing_player = self.guessing_order_start
         
         self.phase = GamePhase.GUESSING
+        self.version += 1
     
     def make_guess(self, player_id: str, guess: int) -> bool:
         """Player makes a guess for the current phase"""
@@ -124,6 +139,7 @@ class Game:
             return False
         
         player.make_guess(guess)
+        self.version += 1
         
         # Move to next player in anti-clockwise order
         self.current_guessing_player = (self.current_guessing_player - 1) % len(active_players)
@@ -204,6 +220,7 @@ class Game:
         try:
             card = player.play_card_by_value(card_number, card_seed)
             self.played_cards.append((player_id, card))
+            self.version += 1
             
             # Move to next player
             self.current_player_index = (self.current_player_index + 1) % len(active_players)
@@ -255,6 +272,12 @@ class Game:
         """End the current phase and check guesses"""
         self.phase = GamePhase.PHASE_END
         
+        self.phase_history.append({
+            p.player_id: (p.guess, p.turns_won)
+            for p in self.players
+            if not p.is_eliminated and p.guess is not None
+        })
+        
         # Check each player's guess against their actual wins
         for player in self.players:
             if not player.is_eliminated and player.guess is not None:
@@ -272,6 +295,154 @@ class Game:
             self.current_phase_index = (self.current_phase_index + 1) % len(self.PHASE_SEQUENCE)
             self._start_new_phase()
     
+    def get_results(self) -> List[Dict]:
+        """Get the final results of a finished game for every player"""
+        if self.phase != GamePhase.GAME_OVER:
+            return []
+        
+        # A player's standing is the number of phases they took part in;
+        # players eliminated in the same phase share a placement
+        phases_played = {
+            p.player_id: sum(1 for phase in self.phase_history if p.player_id in phase)
+            for p in self.players
+        }
+        
+        results = []
+        for player in self.players:
+            played = phases_played[player.player_id]
+            if player.player_id == self.winner:
+                placement = 1
+            else:
+                placement = 1 + sum(
+                    1 for p in self.players
+                    if p.player_id != player.player_id and
+                    (p.player_id == self.winner or phases_played[p.player_id] > played)
+                )
+            
+            lives_lost_per_phase = [
+                int(phase[player.player_id][0] != phase[player.player_id][1])
+                for phase in self.phase_history
+                if player.player_id in phase
+            ]
+            
+            results.append({
+                'player_id': player.player_id,
+                'user_id': player.user_id,
+                'name': player.name,
+                'placement': placement,
+                'lives_lost_per_phase': lives_lost_per_phase,
+                'guesses_made': len(lives_lost_per_phase),
+                'guesses_correct': lives_lost_per_phase.count(0)
+            })
+        
+        return results
+    
+    def clone(self) -> 'Game':
+        """Copy the game for search, copying only the mutable state"""
+        game = Game.__new__(Game)
+        game.__dict__.update(self.__dict__)
+        game.players = [player.clone() for player in self.players]
+        game.deck = self.deck.clone()
+        game.played_cards = list(self.played_cards)
+        game.turn_results = list(self.turn_results)
+        game.phase_history = list(self.phase_history)  # Finished phases are never modified
+        game._undo_stack = []
+        game.lock = threading.RLock()
+        return game
+    
+    def legal_moves(self) -> List[Move]:
+        """Get every move the player to act can make"""
+        active_players = [p for p in self.players if not p.is_eliminated]
+        
+        if self.phase == GamePhase.GUESSING:
+            player_id = active_players[self.current_guessing_player].player_id
+            return [Move(player_id, guess=guess) for guess in self.get_valid_guesses(player_id)]
+        
+        if self.phase == GamePhase.PLAYING:
+            player = active_players[self.current_player_index]
+            return [Move(player.player_id, card=card) for card in player.hand]
+        
+        return []
+    
+    def apply(self, move: Move) -> bool:
+        """Apply a move, recording how to undo it"""
+        if move.card is None and move.guess is None:
+            return False
+        
+        if move.card is None:
+            record = ('guess', self.current_guessing_player, self.phase)
+            if not self.make_guess(move.player_id, move.guess):
+                return False
+        else:
+            player = self._get_player(move.player_id)
+            if not player or move.card not in player.hand:
+                return False
+            
+            active_count = sum(1 for p in self.players if not p.is_eliminated)
+            cards_in_phase = self.PHASE_SEQUENCE[self.current_phase_index]
+            if (len(self.played_cards) + 1 == active_count and
+                    self.current_turn + 1 >= cards_in_phase):
+                # The last card of a phase scores it and deals the next one,
+                # so keep a full copy instead of a per-field record
+                record = ('snapshot', self.clone())
+            else:
+                record = ('play', player.hand.index(move.card), self.current_player_index,
+                          self.played_cards, self.current_turn)
+            
+            if not self.play_card(move.player_id, move.card.number, move.card.seed.name):
+                return False
+        
+        self._undo_stack.append((move, record))
+        return True
+    
+    def undo(self) -> Optional[Move]:
+        """Undo the last applied move and return it"""
+        if not self._undo_stack:
+            return None
+        
+        move, record = self._undo_stack.pop()
+        
+        if record[0] == 'guess':
+            _, self.current_guessing_player, self.phase = record
+            self._get_player(move.player_id).guess = None
+        elif record[0] == 'play':
+            _, hand_index, self.current_player_index, played_cards, current_turn = record
+            if self.current_turn != current_turn:
+                # The card completed a turn: take the win back
+                self._get_player(self.turn_results.pop()).turns_won -= 1
+                self.played_cards = played_cards
+                self.current_turn = current_turn
+            self.played_cards.pop()
+            self._get_player(move.player_id).hand.insert(hand_index, move.card)
+        else:
+            snapshot = record[1]
+            undo_stack = self._undo_stack
+            version = self.version
+            lock = self.lock
+            self.__dict__.update(snapshot.__dict__)
+            self._undo_stack = undo_stack
+            self.version = version
+            self.lock = lock
+        
+        self.version += 1
+        return move
+    
+    def apply_all(self, moves: List[Move]) -> Optional[int]:
+        """Apply moves in order, or none of them if one is illegal
+
+        Returns the index of the first illegal move, or None when all applied.
+        """
+        for index, move in enumerate(moves):
+            if not self.apply(move):
+                for _ in range(index):
+                    self.undo()
+                return index
+        
+        # Applied moves are final: drop their undo records
+        if moves:
+            del self._undo_stack[-len(moves):]
+        return None
+    
     def _get_player(self, player_id: str) -> Optional[Player]:
         """Get a player by ID"""
         for player in self.players:
@@ -294,6 +465,7 @@ class Game:
         """Convert game to dictionary representation"""
         data = {
             'game_id': self.game_id,
+            'version': self.version,
             'phase': self.phase.value,
             'current_phase_index': self.current_phase_index,
             'cards_in_current_phase': self.PHASE_SEQUENCE[self.current_phase_index],
@@ -334,4 +506,9 @@ class Game:
         data['current_player_id'] = current_player.player_id if current_player else None
         
         return data
-
+    
+    def to_public_dict(self):
+        """Convert game to the hand-free view shown to spectators"""
+        data = self.to_dict()
+        data.pop('valid_guesses', None)
+        return data
@@ -0,0 +1,85 @@
+from typing import Dict, List, Optional, Tuple
+import threading
+from src.models.game import Game
+
+
+class Matchmaker:
+    MIN_TABLE_SIZE = 2
+    MAX_TABLE_SIZE = 8
+
+    def __init__(self, games: Optional[Dict[str, Game]] = None):
+        # Formed games are stored here before their players see an assignment
+        self.games = games if games is not None else {}
+        # One FIFO bucket per table size. Dicts keep insertion order, so the
+        # oldest waiting players are matched first and leaving is O(1).
+        self.queues: Dict[int, Dict[str, Tuple[str, Optional[int]]]] = {
+            size: {} for size in range(self.MIN_TABLE_SIZE, self.MAX_TABLE_SIZE + 1)
+        }
+        self.waiting: Dict[str, int] = {}  # player_id -> preferred table size
+        self.assignments: Dict[str, str] = {}  # player_id -> game_id
+        self._lock = threading.Lock()
+
+    def enqueue(self, player_id: str, name: str, table_size: int,
+                user_id: Optional[int] = None) -> List[Game]:
+        """Queue a player for a table of the given size and return any games formed"""
+        if table_size < self.MIN_TABLE_SIZE or table_size > self.MAX_TABLE_SIZE:
+            raise ValueError(
+                f"Table size must be between {self.MIN_TABLE_SIZE} and {self.MAX_TABLE_SIZE}"
+            )
+
+        with self._lock:
+            if player_id in self.waiting or player_id in self.assignments:
+                raise ValueError("Player is already in matchmaking")
+
+            self.queues[table_size][player_id] = (name, user_id)
+            self.waiting[player_id] = table_size
+            return self._match(table_size)
+
+    def leave(self, player_id: str) -> bool:
+        """Remove a waiting player from the queue"""
+        with self._lock:
+            table_size = self.waiting.pop(player_id, None)
+            if table_size is None:
+                return False
+            del self.queues[table_size][player_id]
+            return True
+
+    def get_assignment(self, player_id: str) -> Optional[str]:
+        """Get the game_id a player was placed into, if any"""
+        return self.assignments.get(player_id)
+
+    def is_waiting(self, player_id: str) -> bool:
+        """Check if a player is still waiting for a table"""
+        return player_id in self.waiting
+
+    def queue_size(self, table_size: int) -> int:
+        """Return the number of players waiting for a table size"""
+        return len(self.queues.get(table_size, {}))
+
+    def forget_game(self, game: Game):
+        """Drop the assignments of a game that no longer exists"""
+        with self._lock:
+            for player in game.players:
+                if self.assignments.get(player.player_id) == game.game_id:
+                    del self.assignments[player.player_id]
+
+    def _match(self, table_size: int) -> List[Game]:
+        """Form full games from a bucket while it has enough waiting players"""
+        queue = self.queues[table_size]
+        formed_games = []
+
+        while len(queue) >= table_size:
+            game = Game()
+            game.max_players = table_size
+            for _ in range(table_size):
+                player_id = next(iter(queue))
+                name, user_id = queue.pop(player_id)
+                del self.waiting[player_id]
+                game.add_player(player_id, name, user_id)
+                self.assignments[player_id] = game.game_id
+
+            game.start_game()
+            self.games[game.game_id] = game
+            formed_games.append(game)
+
+        return formed_games
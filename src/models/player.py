@@ -3,9 +3,10 @@ from src.models.card import Card
 
 
 class Player:
-    def __init__(self, player_id: str, name: str):
+    def __init__(self, player_id: str, name: str, user_id: Optional[int] = None):
         self.player_id = player_id
         self.name = name
+        self.user_id = user_id  # Registered user this player plays as, if any
         self.lives = 5
         self.hand: List[Card] = []
         self.guess: Optional[int] = None
@@ -57,6 +58,16 @@ class Player:
         self.guess = None
         self.turns_won = 0
     
+    def clone(self) -> 'Player':
+        """Copy the player, sharing the (immutable) cards in hand"""
+        player = Player(self.player_id, self.name, self.user_id)
+        player.lives = self.lives
+        player.hand = list(self.hand)
+        player.guess = self.guess
+        player.turns_won = self.turns_won
+        player.is_eliminated = self.is_eliminated
+        return player
+    
     def to_dict(self, include_hand=True):
         """Convert player to dictionary representation"""
         data = {
@@ -0,0 +1,209 @@
+from datetime import datetime, timezone
+from sqlalchemy import and_, func, or_
+from sqlalchemy.dialects.sqlite import insert
+from src.models.user import db
+
+
+class GameResult(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    game_id = db.Column(db.String(36), nullable=False, index=True)
+    player_id = db.Column(db.String(36), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True)
+    player_name = db.Column(db.String(80), nullable=False)
+    placement = db.Column(db.Integer, nullable=False)
+    num_players = db.Column(db.Integer, nullable=False)
+    lives_lost_per_phase = db.Column(db.JSON, nullable=False)
+    guesses_made = db.Column(db.Integer, nullable=False)
+    guesses_correct = db.Column(db.Integer, nullable=False)
+    finished_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    __table_args__ = (
+        db.UniqueConstraint('game_id', 'player_id'),
+        db.Index('ix_game_result_user_history', 'user_id', 'id'),
+    )
+
+    def __repr__(self):
+        return f'<GameResult {self.game_id} {self.player_name}>'
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'game_id': self.game_id,
+            'user_id': self.user_id,
+            'player_name': self.player_name,
+            'placement': self.placement,
+            'num_players': self.num_players,
+            'lives_lost_per_phase': self.lives_lost_per_phase,
+            'guesses_made': self.guesses_made,
+            'guesses_correct': self.guesses_correct,
+            'finished_at': self.finished_at.isoformat()
+        }
+
+
+class PlayerStats(db.Model):
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), primary_key=True)
+    games_played = db.Column(db.Integer, nullable=False, default=0)
+    wins = db.Column(db.Integer, nullable=False, default=0)
+    placement_total = db.Column(db.Integer, nullable=False, default=0)
+    phases_played = db.Column(db.Integer, nullable=False, default=0)
+    lives_lost = db.Column(db.Integer, nullable=False, default=0)
+    guesses_correct = db.Column(db.Integer, nullable=False, default=0)
+    points = db.Column(db.Integer, nullable=False, default=0)  # Opponents outplaced, summed over games
+
+    def __repr__(self):
+        return f'<PlayerStats {self.user_id}>'
+
+    def rank(self):
+        """Leaderboard rank from the points histogram; users with equal points share it"""
+        above = db.session.query(func.coalesce(func.sum(PointsBucket.players), 0)).filter(
+            PointsBucket.points > self.points
+        ).scalar()
+        return 1 + above
+
+    def to_dict(self):
+        return {
+            'user_id': self.user_id,
+            'games_played': self.games_played,
+            'wins': self.wins,
+            'average_placement': self.placement_total / self.games_played if self.games_played else None,
+            'phases_played': self.phases_played,
+            'lives_lost': self.lives_lost,
+            'guess_accuracy': self.guesses_correct / self.phases_played if self.phases_played else None,
+            'points': self.points
+        }
+
+
+# Serves leaderboard pages
+db.Index('ix_player_stats_leaderboard', PlayerStats.points.desc(), PlayerStats.user_id)
+
+
+class PointsBucket(db.Model):
+    """Number of players with a given points total, kept up to date at game end"""
+    points = db.Column(db.Integer, primary_key=True)
+    players = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f'<PointsBucket {self.points}: {self.players}>'
+
+
+def _ranked_after(points, user_id):
+    """Filter for the stats rows placed behind (points, user_id) on the leaderboard"""
+    return or_(
+        PlayerStats.points < points,
+        and_(PlayerStats.points == points, PlayerStats.user_id > user_id)
+    )
+
+
+def record_game_results(game):
+    """Store the results of a finished game and fold them into player aggregates"""
+    results = game.get_results()
+    if not results:
+        return False
+
+    if GameResult.query.filter_by(game_id=game.game_id).first():
+        return False
+
+    for result in results:
+        db.session.add(GameResult(
+            game_id=game.game_id,
+            player_id=result['player_id'],
+            user_id=result['user_id'],
+            player_name=result['name'],
+            placement=result['placement'],
+            num_players=len(results),
+            lives_lost_per_phase=result['lives_lost_per_phase'],
+            guesses_made=result['guesses_made'],
+            guesses_correct=result['guesses_correct']
+        ))
+
+        if result['user_id'] is not None:
+            # Players eliminated together share a placement: neither outplaces
+            # the other, and a shared first place is not a win
+            outplaced = sum(1 for other in results if other['placement'] > result['placement'])
+            _add_to_stats(result, outplaced, result['player_id'] == game.winner)
+
+    db.session.commit()
+    return True
+
+
+def _add_to_stats(result, outplaced, won):
+    """Increment a user's aggregates in place instead of recomputing them from results"""
+    increments = {
+        'games_played': 1,
+        'wins': int(won),
+        'placement_total': result['placement'],
+        'phases_played': result['guesses_made'],
+        'lives_lost': sum(result['lives_lost_per_phase']),
+        'guesses_correct': result['guesses_correct'],
+        'points': outplaced
+    }
+
+    # One upsert both applies the increments and returns the new totals, so
+    # games of the same user finishing together cannot read stale points
+    statement = insert(PlayerStats).values(user_id=result['user_id'], **increments)
+    statement = statement.on_conflict_do_update(
+        index_elements=[PlayerStats.user_id],
+        set_={column: getattr(PlayerStats, column) + value for column, value in increments.items()}
+    ).returning(PlayerStats.games_played, PlayerStats.points)
+    games_played, new_points = db.session.execute(statement).one()
+
+    if games_played == 1:
+        _add_to_bucket(new_points, 1)
+    elif increments['points']:
+        _add_to_bucket(new_points - increments['points'], -1)
+        _add_to_bucket(new_points, 1)
+
+
+def _add_to_bucket(points, players):
+    """Add (or with a negative count, remove) players at a points total"""
+    statement = insert(PointsBucket).values(points=points, players=players)
+    db.session.execute(statement.on_conflict_do_update(
+        index_elements=[PointsBucket.points],
+        set_={'players': PointsBucket.players + players}
+    ))
+
+
+def get_leaderboard(limit, cursor=None):
+    """Get one leaderboard page using keyset pagination
+
+    The cursor is the (points, user_id, rank) of the last row of the previous
+    page, so pages are read straight off the leaderboard index without
+    offsets or counting. Users with equal points share a rank; the next
+    points total down ranks after all of them, found in the histogram.
+    """
+    query = PlayerStats.query
+    last_points, rank = None, 1
+
+    if cursor is not None:
+        last_points, user_id, rank = cursor
+        query = query.filter(_ranked_after(last_points, user_id))
+
+    page = query.order_by(PlayerStats.points.desc(), PlayerStats.user_id).limit(limit).all()
+
+    entries = []
+    for stats in page:
+        if last_points is not None and stats.points != last_points:
+            rank += db.session.get(PointsBucket, last_points).players
+        last_points = stats.points
+        entries.append(dict(stats.to_dict(), rank=rank))
+
+    next_cursor = None
+    if page and len(page) == limit:
+        last = entries[-1]
+        next_cursor = f"{last['points']}.{last['user_id']}.{last['rank']}"
+
+    return entries, next_cursor
+
+
+def parse_leaderboard_cursor(cursor):
+    """Parse a leaderboard cursor string into (points, user_id, rank)"""
+    points, user_id, rank = (int(part) for part in cursor.split('.'))
+    return points, user_id, rank
+
+
+def get_user_results(user_id, limit, before_id=None):
+    """Get a page of a user's finished games, newest first"""
+    query = GameResult.query.filter_by(user_id=user_id)
+    if before_id is not None:
+        query = query.filter(GameResult.id < before_id)
+    return query.order_by(GameResult.id.desc()).limit(limit).all()
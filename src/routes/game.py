@@ -1,6 +1,12 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from flask_cors import cross_origin
-from src.models.game import Game, GamePhase
+from src.models.card import Card, Seed
+from src.models.game import Game, GamePhase, Move
+from src.models.matchmaking import Matchmaker
+from src.models.stats import record_game_results
+from src.models.user import User, db
+from src.routes.rate_limit import RateLimiter
+import json
 import uuid
 
 game_bp = Blueprint('game', __name__)
@@ -8,6 +14,17 @@ game_bp = Blueprint('game', __name__)
 # In-memory storage for games (in production, use a database)
 games = {}
 
+# Quick-match queue, bucketed by preferred table size; formed games go into `games`
+matchmaker = Matchmaker(games)
+
+# Encoded spectator responses per game: game_id -> (version, body)
+spectator_views = {}
+
+# Spectators get their own budget so they can never starve player actions:
+# one bucket per client, and one shared by all spectators together
+spectator_limiter = RateLimiter(rate=2, burst=10)
+spectators_total_limiter = RateLimiter(rate=200, burst=400, max_clients=1)
+
 
 @game_bp.route('/games', methods=['POST'])
 @cross_origin()
@@ -16,18 +33,23 @@ def create_game():
     try:
         data = request.get_json()
         player_name = data.get('player_name', 'Player')
+        user_id = data.get('user_id')
         player_id = str(uuid.uuid4())
         
-        game = Game()
-        game.add_player(player_id, player_name)
-        games[game.game_id] = game
+        if not _user_exists(user_id):
+            return jsonify({'success': False, 'error': 'User not found'}), 404
         
-        return jsonify({
-            'success': True,
-            'game_id': game.game_id,
-            'player_id': player_id,
-            'game_state': game.to_dict(player_id)
-        }), 201
+        game = Game()
+        with game.lock:
+            game.add_player(player_id, player_name, user_id)
+            games[game.game_id] = game
+            
+            return jsonify({
+                'success': True,
+                'game_id': game.game_id,
+                'player_id': player_id,
+                'game_state': game.to_dict(player_id)
+            }), 201
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 400
 
@@ -43,16 +65,21 @@ def join_game(game_id):
         game = games[game_id]
         data = request.get_json()
         player_name = data.get('player_name', 'Player')
+        user_id = data.get('user_id')
         player_id = str(uuid.uuid4())
         
-        if not game.add_player(player_id, player_name):
-            return jsonify({'success': False, 'error': 'Cannot join game (full or already started)'}), 400
+        if not _user_exists(user_id):
+            return jsonify({'success': False, 'error': 'User not found'}), 404
         
-        return jsonify({
-            'success': True,
-            'player_id': player_id,
-            'game_state': game.to_dict(player_id)
-        }), 200
+        with game.lock:
+            if not game.add_player(player_id, player_name, user_id):
+                return jsonify({'success': False, 'error': 'Cannot join game (full or already started)'}), 400
+            
+            return jsonify({
+                'success': True,
+                'player_id': player_id,
+                'game_state': game.to_dict(player_id)
+            }), 200
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 400
 
@@ -67,13 +94,14 @@ def start_game(game_id):
         
         game = games[game_id]
         
-        if not game.start_game():
-            return jsonify({'success': False, 'error': 'Cannot start game (not enough players or already started)'}), 400
-        
-        return jsonify({
-            'success': True,
-            'game_state': game.to_dict()
-        }), 200
+        with game.lock:
+            if not game.start_game():
+                return jsonify({'success': False, 'error': 'Cannot start game (not enough players or already started)'}), 400
+            
+            return jsonify({
+                'success': True,
+                'game_state': game.to_dict()
+            }), 200
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 400
 
@@ -91,13 +119,14 @@ def make_guess(game_id):
         player_id = data.get('player_id')
         guess = data.get('guess')
         
-        if not game.make_guess(player_id, guess):
-            return jsonify({'success': False, 'error': 'Invalid guess or not guessing phase'}), 400
-        
-        return jsonify({
-            'success': True,
-            'game_state': game.to_dict(player_id)
-        }), 200
+        with game.lock:
+            if not game.make_guess(player_id, guess):
+                return jsonify({'success': False, 'error': 'Invalid guess or not guessing phase'}), 400
+            
+            return jsonify({
+                'success': True,
+                'game_state': game.to_dict(player_id)
+            }), 200
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 400
 
@@ -116,17 +145,90 @@ def play_card(game_id):
         card_number = data.get('card_number')
         card_seed = data.get('card_seed')
         
-        if not game.play_card(player_id, card_number, card_seed):
-            return jsonify({'success': False, 'error': 'Invalid card play'}), 400
+        with game.lock:
+            if not game.play_card(player_id, card_number, card_seed):
+                return jsonify({'success': False, 'error': 'Invalid card play'}), 400
+            
+            if game.phase == GamePhase.GAME_OVER:
+                _finish_game(game)
+            
+            return jsonify({
+                'success': True,
+                'game_state': game.to_dict(player_id)
+            }), 200
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+
+@game_bp.route('/games/<game_id>/actions', methods=['POST'])
+@cross_origin()
+def apply_actions(game_id):
+    """Apply a list of guesses and card plays in order, all or none"""
+    try:
+        if game_id not in games:
+            return jsonify({'success': False, 'error': 'Game not found'}), 404
+        
+        game = games[game_id]
+        data = request.get_json()
+        actions = data.get('actions')
+        
+        if not isinstance(actions, list) or not actions:
+            return jsonify({'success': False, 'error': 'actions must be a non-empty list'}), 400
         
-        return jsonify({
-            'success': True,
-            'game_state': game.to_dict(player_id)
-        }), 200
+        moves = []
+        for index, action in enumerate(actions):
+            move = _parse_action(action)
+            if move is None:
+                return jsonify({
+                    'success': False,
+                    'error': 'Malformed action',
+                    'failed_index': index
+                }), 400
+            moves.append(move)
+        
+        with game.lock:
+            failed_index = game.apply_all(moves)
+            if failed_index is not None:
+                return jsonify({
+                    'success': False,
+                    'error': 'Invalid guess' if moves[failed_index].card is None else 'Invalid card play',
+                    'failed_index': failed_index
+                }), 400
+            
+            if game.phase == GamePhase.GAME_OVER:
+                _finish_game(game)
+            
+            return jsonify({
+                'success': True,
+                'applied': len(moves),
+                'game_state': game.to_dict(data.get('player_id'))
+            }), 200
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 400
 
 
+def _parse_action(action):
+    """Turn one action of a batch into a Move, or None if it is malformed"""
+    if not isinstance(action, dict) or not isinstance(action.get('player_id'), str):
+        return None
+    
+    if action.get('type') == 'guess':
+        guess = action.get('guess')
+        if not isinstance(guess, int) or isinstance(guess, bool):
+            return None
+        return Move(action['player_id'], guess=guess)
+    
+    if action.get('type') == 'play':
+        card_number = action.get('card_number')
+        card_seed = action.get('card_seed')
+        if (not isinstance(card_number, int) or isinstance(card_number, bool)
+                or not 1 <= card_number <= 10 or card_seed not in Seed.__members__):
+            return None
+        return Move(action['player_id'], card=Card(card_number, Seed[card_seed]))
+    
+    return None
+
+
 @game_bp.route('/games/<game_id>/state', methods=['GET'])
 @cross_origin()
 def get_game_state(game_id):
@@ -138,27 +240,74 @@ def get_game_state(game_id):
         game = games[game_id]
         player_id = request.args.get('player_id')
         
-        return jsonify({
-            'success': True,
-            'game_state': game.to_dict(player_id)
-        }), 200
+        with game.lock:
+            return jsonify({
+                'success': True,
+                'game_state': game.to_dict(player_id)
+            }), 200
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+
+@game_bp.route('/games/<game_id>/spectate', methods=['GET'])
+@cross_origin()
+def spectate_game(game_id):
+    """Get the public view of a game for spectators"""
+    try:
+        if (not spectator_limiter.allow(request.remote_addr or 'unknown')
+                or not spectators_total_limiter.allow('all')):
+            return jsonify({'success': False, 'error': 'Too many spectator requests'}), 429
+        
+        if game_id not in games:
+            return jsonify({'success': False, 'error': 'Game not found'}), 404
+        
+        game = games[game_id]
+        version, body = _get_spectator_view(game)
+        
+        response = current_app.response_class(body, mimetype='application/json')
+        response.set_etag(f"{game_id}-{version}")
+        return response.make_conditional(request)
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 400
 
 
+def _get_spectator_view(game):
+    """Return the encoded public view, encoding it once per state change"""
+    cached = spectator_views.get(game.game_id)
+    if cached and cached[0] == game.version:
+        return cached
+    
+    # Only this game's lock: encoding one game never holds up the others
+    with game.lock:
+        cached = spectator_views.get(game.game_id)
+        if cached and cached[0] == game.version:
+            return cached
+        
+        version = game.version
+        body = json.dumps({
+            'success': True,
+            'game_state': game.to_public_dict()
+        })
+        cached = (version, body)
+        if games.get(game.game_id) is game:  # Not deleted while waiting for the lock
+            spectator_views[game.game_id] = cached
+        return cached
+
+
 @game_bp.route('/games', methods=['GET'])
 @cross_origin()
 def list_games():
     """List all available games"""
     try:
         game_list = []
-        for game_id, game in games.items():
-            if game.phase == GamePhase.WAITING:
-                game_list.append({
-                    'game_id': game_id,
-                    'players': len(game.players),
-                    'max_players': game.max_players
-                })
+        for game_id, game in list(games.items()):
+            with game.lock:
+                if game.phase == GamePhase.WAITING:
+                    game_list.append({
+                        'game_id': game_id,
+                        'players': len(game.players),
+                        'max_players': game.max_players
+                    })
         
         return jsonify({
             'success': True,
@@ -173,10 +322,15 @@ def list_games():
 def delete_game(game_id):
     """Delete a game"""
     try:
-        if game_id not in games:
+        game = games.get(game_id)
+        if game is None:
             return jsonify({'success': False, 'error': 'Game not found'}), 404
         
-        del games[game_id]
+        # Let requests already working on the game finish first
+        with game.lock:
+            games.pop(game_id, None)
+            matchmaker.forget_game(game)
+            spectator_views.pop(game_id, None)
         
         return jsonify({
             'success': True,
@@ -185,3 +339,100 @@ def delete_game(game_id):
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 400
 
+
+
+@game_bp.route('/matchmaking', methods=['POST'])
+@cross_origin()
+def join_matchmaking():
+    """Queue a player for a quick-match table of the preferred size"""
+    try:
+        data = request.get_json()
+        player_name = data.get('player_name', 'Player')
+        table_size = data.get('table_size')
+        user_id = data.get('user_id')
+        player_id = str(uuid.uuid4())
+        
+        if not isinstance(table_size, int):
+            return jsonify({'success': False, 'error': 'Table size must be an integer'}), 400
+        
+        if not _user_exists(user_id):
+            return jsonify({'success': False, 'error': 'User not found'}), 404
+        
+        matchmaker.enqueue(player_id, player_name, table_size, user_id)
+        
+        return jsonify(_matchmaking_status(player_id)), 201
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+
+@game_bp.route('/matchmaking/<player_id>', methods=['GET'])
+@cross_origin()
+def get_matchmaking_status(player_id):
+    """Get the quick-match status of a player"""
+    try:
+        if not matchmaker.is_waiting(player_id) and not matchmaker.get_assignment(player_id):
+            return jsonify({'success': False, 'error': 'Player not in matchmaking'}), 404
+        
+        return jsonify(_matchmaking_status(player_id)), 200
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+
+@game_bp.route('/matchmaking/<player_id>', methods=['DELETE'])
+@cross_origin()
+def leave_matchmaking(player_id):
+    """Leave the quick-match queue"""
+    try:
+        if not matchmaker.leave(player_id):
+            return jsonify({'success': False, 'error': 'Player not waiting in matchmaking'}), 404
+        
+        return jsonify({
+            'success': True,
+            'message': 'Left matchmaking'
+        }), 200
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+
+def _finish_game(game):
+    """Release a finished game's matchmaking assignments and record its results
+
+    The moves are already final, so a failed write is logged instead of
+    failing the request that finished the game.
+    """
+    matchmaker.forget_game(game)
+    try:
+        record_game_results(game)
+    except Exception:
+        db.session.rollback()
+        current_app.logger.exception("Could not record the results of game %s", game.game_id)
+
+
+def _user_exists(user_id):
+    """Check that an optional user_id refers to a registered user"""
+    return user_id is None or db.session.get(User, user_id) is not None
+
+
+def _matchmaking_status(player_id):
+    """Build the matchmaking poll response for a player"""
+    game_id = matchmaker.get_assignment(player_id)
+    game = games.get(game_id) if game_id else None
+    
+    if game is None:
+        table_size = matchmaker.waiting.get(player_id)
+        return {
+            'success': True,
+            'player_id': player_id,
+            'status': 'waiting',
+            'table_size': table_size,
+            'players_waiting': matchmaker.queue_size(table_size) if table_size else 0
+        }
+    
+    with game.lock:
+        return {
+            'success': True,
+            'player_id': player_id,
+            'status': 'matched',
+            'game_id': game.game_id,
+            'game_state': game.to_dict(player_id)
+        }
@@ -0,0 +1,37 @@
+from collections import OrderedDict
+from typing import List
+import threading
+import time
+
+
+class RateLimiter:
+    def __init__(self, rate: float, burst: int, max_clients: int = 10000):
+        """Token bucket per client: `rate` requests per second, bursts up to `burst`"""
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        # client -> [tokens, last_refill], least recently seen first
+        self.buckets: 'OrderedDict[str, List[float]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def allow(self, client: str) -> bool:
+        """Consume a token for the client, returning False when it is rate limited"""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self.buckets.get(client)
+            if bucket is None:
+                if len(self.buckets) >= self.max_clients:
+                    # Forget the least recently seen client; it starts over with a full bucket
+                    self.buckets.popitem(last=False)
+                bucket = self.buckets[client] = [float(self.burst), now]
+            else:
+                self.buckets.move_to_end(client)
+
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if tokens < 1:
+                bucket[0] = tokens
+                return False
+
+            bucket[0] = tokens - 1
+            return True
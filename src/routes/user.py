@@ -1,5 +1,6 @@
 from flask import Blueprint, jsonify, request
 from src.models.user import User, db
+from src.models.stats import PlayerStats, get_leaderboard, get_user_results, parse_leaderboard_cursor
 
 user_bp = Blueprint('user', __name__)
 
@@ -37,3 +38,37 @@ def delete_user(user_id):
     db.session.delete(user)
     db.session.commit()
     return '', 204
+
+@user_bp.route('/users/<int:user_id>/stats', methods=['GET'])
+def get_user_stats(user_id):
+    User.query.get_or_404(user_id)
+    stats = db.session.get(PlayerStats, user_id)
+    if stats is None:
+        return jsonify({'user_id': user_id, 'games_played': 0, 'rank': None})
+    return jsonify(dict(stats.to_dict(), rank=stats.rank()))
+
+@user_bp.route('/users/<int:user_id>/results', methods=['GET'])
+def get_user_game_results(user_id):
+    User.query.get_or_404(user_id)
+    limit = _page_limit()
+    before_id = request.args.get('before', type=int)
+    results = get_user_results(user_id, limit, before_id)
+    return jsonify({
+        'results': [result.to_dict() for result in results],
+        'next': results[-1].id if results and len(results) == limit else None
+    })
+
+@user_bp.route('/leaderboard', methods=['GET'])
+def leaderboard():
+    limit = _page_limit()
+    cursor = request.args.get('cursor')
+    try:
+        cursor = parse_leaderboard_cursor(cursor) if cursor else None
+    except ValueError:
+        return jsonify({'error': 'Invalid cursor'}), 400
+    entries, next_cursor = get_leaderboard(limit, cursor)
+    return jsonify({'entries': entries, 'next': next_cursor})
+
+def _page_limit():
+    """Page size from the `limit` query argument, clamped to 1..100"""
+    return max(1, min(request.args.get('limit', 20, type=int), 100))
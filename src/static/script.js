@@ -15,12 +15,32 @@ let gameState = {
 // API base URL
 const API_BASE = '/api';
 
+// Polling delays (ms): faster on the player's own turn, backing off while the tab is hidden
+const POLL_DELAY_OWN_TURN = 1000;
+const POLL_DELAY_DEFAULT = 2000;
+const POLL_DELAY_HIDDEN_MIN = 5000;
+const POLL_DELAY_HIDDEN_MAX = 30000;
+
+// Render cache: last rendered state and a signature per rebuilt section
+let renderCache = {
+    stateJson: null,
+    latestGame: null,
+    sections: {}
+};
+
 // Initialize the app
 document.addEventListener('DOMContentLoaded', function() {
     initializeEventListeners();
     showScreen('main-menu');
 });
 
+// Poll right away when the tab becomes visible again
+document.addEventListener('visibilitychange', () => {
+    if (!document.hidden && pollingActive) {
+        pollGameState();
+    }
+});
+
 // Event Listeners
 function initializeEventListeners() {
     // Main menu
@@ -128,6 +148,7 @@ async function createGame() {
         gameState.gameId = result.game_id;
         gameState.playerId = result.player_id;
         gameState.playerName = playerName;
+        resetRenderCache();
         
         updateGameLobby(result.game_state);
         showScreen('game-lobby-screen');
@@ -159,6 +180,7 @@ async function joinGame(gameId = null) {
         gameState.gameId = gameIdInput;
         gameState.playerId = result.player_id;
         gameState.playerName = playerName;
+        resetRenderCache();
         
         updateGameLobby(result.game_state);
         showScreen('game-lobby-screen');
@@ -226,25 +248,115 @@ async function getGameState() {
     }
 }
 
-// UI update functions
-function updateGameLobby(game) {
-    document.getElementById('lobby-game-id').textContent = game.game_id;
+// Incremental rendering helpers
+function hasStateChanged(game) {
+    // Identical polls are skipped entirely
+    const stateJson = JSON.stringify(game);
+    if (stateJson === renderCache.stateJson) {
+        return false;
+    }
     
-    const playersContainer = document.getElementById('lobby-players');
-    playersContainer.innerHTML = '';
+    renderCache.stateJson = stateJson;
+    renderCache.latestGame = game;
+    return true;
+}
+
+function sectionChanged(section, signature) {
+    if (renderCache.sections[section] === signature) {
+        return false;
+    }
     
-    game.players.forEach(player => {
-        const playerDiv = document.createElement('div');
-        playerDiv.className = 'player-item';
-        playerDiv.innerHTML = `
-            <span class="player-name">${player.name}</span>
-            <span class="player-lives">${'♥'.repeat(player.lives)}</span>
-        `;
-        playersContainer.appendChild(playerDiv);
+    renderCache.sections[section] = signature;
+    return true;
+}
+
+function resetRenderCache() {
+    renderCache = {
+        stateJson: null,
+        latestGame: null,
+        sections: {}
+    };
+    
+    ['lobby-players', 'players-info', 'other-guesses', 'guessing-hand-cards', 'played-cards-area', 'hand-cards']
+        .forEach(id => {
+            const container = document.getElementById(id);
+            if (container) {
+                container.innerHTML = '';
+            }
+        });
+}
+
+function setText(element, text) {
+    text = String(text);
+    if (element.textContent !== text) {
+        element.textContent = text;
+    }
+}
+
+function reconcileList(container, items, getKey, createNode, updateNode) {
+    // Reuse the keyed children of the container, creating, moving and removing only what changed
+    const existing = new Map();
+    container.querySelectorAll(':scope > [data-key]').forEach(node => {
+        existing.set(node.dataset.key, node);
+    });
+    
+    let nextNode = container.querySelector(':scope > [data-key]');
+    
+    items.forEach(item => {
+        const key = getKey(item);
+        let node = existing.get(key);
+        
+        if (node) {
+            existing.delete(key);
+        } else {
+            node = createNode(item);
+            node.dataset.key = key;
+        }
+        
+        if (node !== nextNode) {
+            container.insertBefore(node, nextNode);
+        }
+        
+        updateNode(node, item);
+        nextNode = node.nextSibling;
     });
+    
+    existing.forEach(node => node.remove());
+}
+
+function cardKey(card) {
+    return `${card.number}-${card.seed}`;
+}
+
+// UI update functions
+function updateGameLobby(game) {
+    setText(document.getElementById('lobby-game-id'), game.game_id);
+    
+    reconcileList(
+        document.getElementById('lobby-players'),
+        game.players,
+        player => player.player_id,
+        () => {
+            const playerDiv = document.createElement('div');
+            playerDiv.className = 'player-item';
+            playerDiv.innerHTML = `
+                <span class="player-name"></span>
+                <span class="player-lives"></span>
+            `;
+            return playerDiv;
+        },
+        (playerDiv, player) => {
+            setText(playerDiv.querySelector('.player-name'), player.name);
+            setText(playerDiv.querySelector('.player-lives'), '♥'.repeat(player.lives));
+        }
+    );
 }
 
 function updateGameScreen(game) {
+    if (!hasStateChanged(game)) {
+        return;
+    }
+    
     // Check if we should show turn result
     if (shouldShowTurnResult(game)) {
         showTurnResult(game);
@@ -257,16 +369,14 @@ function updateGameScreen(game) {
         return;
     }
     
-    // Update phase info
-    document.getElementById('current-phase').textContent = game.current_phase_index + 1;
-    document.getElementById('cards-in-phase').textContent = game.cards_in_current_phase;
-    document.getElementById('current-turn').textContent = game.current_turn + 1;
-    
-    // Update players status
-    updatePlayersStatus(game);
-    
-    // Show appropriate game phase
-    showGamePhase(game);
+    updateGameScreenNormal(game);
+}
+
+function refreshAfterOverlay(game) {
+    // Render the newest state seen while the overlay was up, re-checking it for results to show
+    const latestGame = renderCache.latestGame || game;
+    renderCache.stateJson = null;
+    updateGameScreen(latestGame);
 }
 
 function shouldShowTurnResult(game) {
@@ -362,7 +472,7 @@ function showTurnResult(game, isPhaseEndTurn = false) {
             gameState.pendingPhaseResult = null;
         } else {
             // Update the game screen normally
-            updateGameScreenNormal(game);
+            refreshAfterOverlay(game);
         }
     }, 3000);
 }
@@ -428,7 +538,7 @@ function showPhaseResult(game) {
         gameState.showingPhaseResult = false;
         
         // Update the game screen normally
-        updateGameScreenNormal(game);
+        refreshAfterOverlay(game);
     }, 4000);
 }
 
@@ -437,9 +547,9 @@ function updateGameScreenNormal(game) {
     gameState.lastPhaseIndex = game.current_phase_index;
     
     // Update phase info
-    document.getElementById('current-phase').textContent = game.current_phase_index + 1;
-    document.getElementById('cards-in-phase').textContent = game.cards_in_current_phase;
-    document.getElementById('current-turn').textContent = game.current_turn + 1;
+    setText(document.getElementById('current-phase'), game.current_phase_index + 1);
+    setText(document.getElementById('cards-in-phase'), game.cards_in_current_phase);
+    setText(document.getElementById('current-turn'), game.current_turn + 1);
     
     // Update players status
     updatePlayersStatus(game);
@@ -449,57 +559,60 @@ function updateGameScreenNormal(game) {
 }
 
 function updatePlayersStatus(game) {
-    const playersContainer = document.getElementById('players-info');
-    playersContainer.innerHTML = '';
-    
-    game.players.forEach(player => {
-        const playerDiv = document.createElement('div');
-        playerDiv.className = 'player-status';
-        
-        if (player.player_id === game.current_player_id) {
-            playerDiv.classList.add('current-player');
-        }
-        
-        if (player.is_eliminated) {
-            playerDiv.classList.add('eliminated');
+    reconcileList(
+        document.getElementById('players-info'),
+        game.players,
+        player => player.player_id,
+        () => {
+            const playerDiv = document.createElement('div');
+            playerDiv.className = 'player-status';
+            playerDiv.innerHTML = `
+                <div class="player-name"></div>
+                <div class="player-lives"></div>
+                <div class="player-guess"></div>
+                <div class="player-wins"></div>
+            `;
+            return playerDiv;
+        },
+        (playerDiv, player) => {
+            playerDiv.classList.toggle('current-player', player.player_id === game.current_player_id);
+            playerDiv.classList.toggle('eliminated', player.is_eliminated);
+            
+            const guessText = player.guess !== null ? `Guess: ${player.guess}` : 'No guess';
+            const winsText = `Wins: ${player.turns_won}`;
+            
+            setText(playerDiv.querySelector('.player-name'), player.name);
+            setText(playerDiv.querySelector('.player-lives'), '♥'.repeat(player.lives));
+            setText(playerDiv.querySelector('.player-guess'), guessText);
+            setText(playerDiv.querySelector('.player-wins'), winsText);
         }
-        
-        const guessText = player.guess !== null ? `Guess: ${player.guess}` : 'No guess';
-        const winsText = `Wins: ${player.turns_won}`;
-        
-        playerDiv.innerHTML = `
-            <div class="player-name">${player.name}</div>
-            <div class="player-lives">${'♥'.repeat(player.lives)}</div>
-            <div class="player-guess">${guessText}</div>
-            <div class="player-wins">${winsText}</div>
-        `;
-        
-        playersContainer.appendChild(playerDiv);
-    });
+    );
 }
 
 function showGamePhase(game) {
-    // Hide all phases
+    const phaseElementIds = {
+        'guessing': 'guessing-phase',
+        'playing': 'playing-phase',
+        'phase_end': 'phase-end',
+        'game_over': 'game-over'
+    };
+    
+    // Show only the current phase
     document.querySelectorAll('.game-phase').forEach(phase => {
-        phase.classList.remove('active');
+        phase.classList.toggle('active', phase.id === phaseElementIds[game.phase]);
     });
     
-    // Show appropriate phase
     switch (game.phase) {
         case 'guessing':
-            document.getElementById('guessing-phase').classList.add('active');
             updateGuessingPhase(game);
             break;
         case 'playing':
-            document.getElementById('playing-phase').classList.add('active');
             updatePlayingPhase(game);
             break;
         case 'phase_end':
-            document.getElementById('phase-end').classList.add('active');
             updatePhaseEnd(game);
             break;
         case 'game_over':
-            document.getElementById('game-over').classList.add('active');
             updateGameOver(game);
             break;
     }
@@ -514,33 +627,40 @@ function updateGuessingPhase(game) {
     // Check if it's this player's turn to guess
     const isMyTurnToGuess = game.current_guessing_player_id === gameState.playerId;
     
+    const guessContainer = document.getElementById('guess-buttons');
+    
     if (currentPlayer && currentPlayer.guess === null && isMyTurnToGuess) {
-        // Show guess buttons with constraints
-        const guessContainer = document.getElementById('guess-buttons');
-        guessContainer.innerHTML = '';
-        
         // Use valid guesses from backend
         const validGuesses = game.valid_guesses || [];
         
-        if (validGuesses.length > 0) {
-            validGuesses.forEach(guess => {
-                const button = document.createElement('button');
-                button.className = 'guess-btn';
-                button.textContent = guess;
-                button.addEventListener('click', () => makeGuess(guess));
-                guessContainer.appendChild(button);
-            });
-        } else {
-            guessContainer.innerHTML = '<p>No valid guesses available</p>';
+        // Show guess buttons with constraints
+        if (sectionChanged('guess-buttons', `choose:${validGuesses.join(',')}`)) {
+            guessContainer.innerHTML = '';
+            
+            if (validGuesses.length > 0) {
+                validGuesses.forEach(guess => {
+                    const button = document.createElement('button');
+                    button.className = 'guess-btn';
+                    button.textContent = guess;
+                    button.addEventListener('click', () => makeGuess(guess));
+                    guessContainer.appendChild(button);
+                });
+            } else {
+                guessContainer.innerHTML = '<p>No valid guesses available</p>';
+            }
         }
     } else if (currentPlayer && currentPlayer.guess !== null) {
         // Player has already guessed
-        document.getElementById('guess-buttons').innerHTML = '<p>You have made your guess. Waiting for other players...</p>';
+        if (sectionChanged('guess-buttons', 'guessed')) {
+            guessContainer.innerHTML = '<p>You have made your guess. Waiting for other players...</p>';
+        }
     } else {
         // Not this player's turn to guess
         const currentGuessingPlayer = game.players.find(p => p.player_id === game.current_guessing_player_id);
         const playerName = currentGuessingPlayer ? currentGuessingPlayer.name : 'Unknown';
-        document.getElementById('guess-buttons').innerHTML = `<p>Waiting for ${playerName} to make their guess...</p>`;
+        if (sectionChanged('guess-buttons', `waiting:${playerName}`)) {
+            guessContainer.innerHTML = `<p>Waiting for ${playerName} to make their guess...</p>`;
+        }
     }
     
     // Show other players' guesses with turn order indication
@@ -549,32 +669,43 @@ function updateGuessingPhase(game) {
 
 function updateOtherGuessesWithOrder(game) {
     const container = document.getElementById('other-guesses');
-    container.innerHTML = '<h4>Player Guesses (Anti-clockwise order):</h4>';
+    if (sectionChanged('other-guesses-title', 'ordered')) {
+        container.innerHTML = '<h4>Player Guesses (Anti-clockwise order):</h4>';
+    }
     
-    game.players.forEach(player => {
-        const guessDiv = document.createElement('div');
-        guessDiv.className = 'guess-item';
-        
-        // Highlight current guessing player
-        if (player.player_id === game.current_guessing_player_id) {
-            guessDiv.classList.add('current-guesser');
+    reconcileList(
+        container,
+        game.players,
+        player => player.player_id,
+        () => {
+            const guessDiv = document.createElement('div');
+            guessDiv.className = 'guess-item';
+            guessDiv.innerHTML = `
+                <span></span>
+                <span></span>
+            `;
+            return guessDiv;
+        },
+        (guessDiv, player) => {
+            const isGuessing = player.player_id === game.current_guessing_player_id;
+            
+            // Highlight current guessing player
+            guessDiv.classList.toggle('current-guesser', isGuessing);
+            
+            const guessText = player.guess !== null ? player.guess : '?';
+            const statusText = isGuessing ? ' (guessing now)' : '';
+            
+            const [nameSpan, guessSpan] = guessDiv.querySelectorAll('span');
+            setText(nameSpan, `${player.name}${statusText}`);
+            setText(guessSpan, guessText);
         }
-        
-        const guessText = player.guess !== null ? player.guess : '?';
-        const statusText = player.player_id === game.current_guessing_player_id ? ' (guessing now)' : '';
-        
-        guessDiv.innerHTML = `
-            <span>${player.name}${statusText}</span>
-            <span>${guessText}</span>
-        `;
-        
-        container.appendChild(guessDiv);
-    });
+    );
 }
 
 function updateOtherGuesses(game) {
     const container = document.getElementById('other-guesses');
     container.innerHTML = '<h4>Player Guesses:</h4>';
+    renderCache.sections['other-guesses-title'] = 'plain';
     
     game.players.forEach(player => {
         const guessDiv = document.createElement('div');
@@ -614,24 +745,28 @@ function updatePlayerHandForGuessing(game) {
         handContainer = document.getElementById('guessing-hand-cards');
     }
     
-    // Clear and populate hand
-    handContainer.innerHTML = '';
-    
-    currentPlayer.hand.forEach(card => {
-        const cardDiv = createCardElement(card, false);
-        cardDiv.classList.add('guessing-card');
-        handContainer.appendChild(cardDiv);
-    });
+    // Patch the hand, keeping the cards that are still held
+    reconcileList(
+        handContainer,
+        currentPlayer.hand,
+        cardKey,
+        card => {
+            const cardDiv = createCardElement(card, false);
+            cardDiv.classList.add('guessing-card');
+            return cardDiv;
+        },
+        () => {}
+    );
 }
 
 function updatePlayingPhase(game) {
     // Update current player info
     const currentPlayerText = document.getElementById('current-player-text');
     if (game.current_player_id === gameState.playerId) {
-        currentPlayerText.textContent = 'Your turn - Choose a card to play';
+        setText(currentPlayerText, 'Your turn - Choose a card to play');
     } else {
         const currentPlayer = game.players.find(p => p.player_id === game.current_player_id);
-        currentPlayerText.textContent = `Waiting for ${currentPlayer ? currentPlayer.name : 'player'} to play`;
+        setText(currentPlayerText, `Waiting for ${currentPlayer ? currentPlayer.name : 'player'} to play`);
     }
     
     // Update played cards
@@ -642,40 +777,50 @@ function updatePlayingPhase(game) {
 }
 
 function updatePlayedCards(game) {
-    const container = document.getElementById('played-cards-area');
-    container.innerHTML = '';
-    
-    game.played_cards.forEach(playedCard => {
-        const cardDiv = createCardElement(playedCard.card, false);
-        cardDiv.classList.add('played-card');
-        
-        const player = game.players.find(p => p.player_id === playedCard.player_id);
-        const label = document.createElement('div');
-        label.className = 'player-label';
-        label.textContent = player ? player.name : 'Unknown';
-        cardDiv.appendChild(label);
-        
-        container.appendChild(cardDiv);
-    });
+    reconcileList(
+        document.getElementById('played-cards-area'),
+        game.played_cards,
+        playedCard => `${playedCard.player_id}-${cardKey(playedCard.card)}`,
+        playedCard => {
+            const cardDiv = createCardElement(playedCard.card, false);
+            cardDiv.classList.add('played-card');
+            
+            const player = game.players.find(p => p.player_id === playedCard.player_id);
+            const label = document.createElement('div');
+            label.className = 'player-label';
+            label.textContent = player ? player.name : 'Unknown';
+            cardDiv.appendChild(label);
+            
+            return cardDiv;
+        },
+        () => {}
+    );
 }
 
 function updatePlayerHand(game) {
     const currentPlayer = game.players.find(p => p.player_id === gameState.playerId);
     if (!currentPlayer) return;
     
-    const container = document.getElementById('hand-cards');
-    container.innerHTML = '';
-    
     const isMyTurn = game.current_player_id === gameState.playerId;
     
-    currentPlayer.hand.forEach(card => {
-        const cardDiv = createCardElement(card, isMyTurn);
-        if (isMyTurn) {
-            cardDiv.classList.add('playable');
-            cardDiv.addEventListener('click', () => playCard(card.number, card.seed));
+    reconcileList(
+        document.getElementById('hand-cards'),
+        currentPlayer.hand,
+        cardKey,
+        card => {
+            const cardDiv = createCardElement(card, false);
+            cardDiv.addEventListener('click', () => {
+                if (cardDiv.classList.contains('playable')) {
+                    playCard(card.number, card.seed);
+                }
+            });
+            return cardDiv;
+        },
+        cardDiv => {
+            cardDiv.classList.toggle('playable', isMyTurn);
+            cardDiv.style.cursor = isMyTurn ? 'pointer' : '';
         }
-        container.appendChild(cardDiv);
-    });
+    );
 }
 
 function createCardElement(card, clickable = false) {
@@ -759,6 +904,11 @@ function getItalianNumberDisplay(number) {
 }
 
 function updatePhaseEnd(game) {
+    const results = game.players.map(p => [p.player_id, p.guess, p.turns_won, p.lives, p.is_eliminated]);
+    if (!sectionChanged('phase-results', JSON.stringify(results))) {
+        return;
+    }
+    
     const container = document.getElementById('phase-results');
     container.innerHTML = '<h4>Phase Results:</h4>';
     
@@ -785,6 +935,10 @@ function updatePhaseEnd(game) {
 }
 
 function updateGameOver(game) {
+    if (!sectionChanged('game-results', `${game.game_id}:${game.winner}`)) {
+        return;
+    }
+    
     const container = document.getElementById('game-results');
     
     if (game.winner) {
@@ -852,6 +1006,7 @@ function leaveGame() {
     gameState.playerId = null;
     gameState.playerName = null;
     stopGameStatePolling();
+    resetRenderCache();
     showScreen('main-menu');
 }
 
@@ -867,17 +1022,50 @@ function continueGame() {
 }
 
 // Game state polling
-let pollingInterval = null;
+let pollingTimer = null;
+let pollingActive = false;
+let pollInFlight = false;
+let hiddenPollDelay = POLL_DELAY_HIDDEN_MIN;
 
 function startGameStatePolling() {
-    if (pollingInterval) {
-        clearInterval(pollingInterval);
+    stopGameStatePolling();
+    pollingActive = true;
+    scheduleNextPoll(POLL_DELAY_DEFAULT);
+}
+
+function scheduleNextPoll(delay) {
+    if (pollingTimer) {
+        clearTimeout(pollingTimer);
+    }
+    pollingTimer = setTimeout(pollGameState, delay);
+}
+
+function nextPollDelay(game) {
+    // Back off exponentially while the tab is hidden
+    if (document.hidden) {
+        const delay = hiddenPollDelay;
+        hiddenPollDelay = Math.min(hiddenPollDelay * 2, POLL_DELAY_HIDDEN_MAX);
+        return delay;
+    }
+    hiddenPollDelay = POLL_DELAY_HIDDEN_MIN;
+    
+    const isMyTurn = game && (game.current_player_id === gameState.playerId ||
+                              game.current_guessing_player_id === gameState.playerId);
+    return isMyTurn ? POLL_DELAY_OWN_TURN : POLL_DELAY_DEFAULT;
+}
+
+async function pollGameState() {
+    if (!pollingActive || pollInFlight) {
+        return;
     }
     
-    pollingInterval = setInterval(async () => {
+    pollInFlight = true;
+    let game = null;
+    
+    try {
         if (gameState.gameId) {
-            const game = await getGameState();
-            if (game) {
+            game = await getGameState();
+            if (game && pollingActive) {
                 // Update based on current screen
                 if (gameState.currentScreen === 'game-lobby-screen') {
                     updateGameLobby(game);
@@ -892,12 +1080,18 @@ function startGameStatePolling() {
                 }
             }
         }
-    }, 2000); // Poll every 2 seconds
+    } finally {
+        pollInFlight = false;
+        if (pollingActive) {
+            scheduleNextPoll(nextPollDelay(game));
+        }
+    }
 }
 
 function stopGameStatePolling() {
-    if (pollingInterval) {
-        clearInterval(pollingInterval);
-        pollingInterval = null;
+    pollingActive = false;
+    if (pollingTimer) {
+        clearTimeout(pollingTimer);
+        pollingTimer = null;
     }
-}
\ No newline at end of file
+}
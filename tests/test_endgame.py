@@ -0,0 +1,111 @@
+import random
+import unittest
+from src.models.endgame import EndgamePosition, EndgameSolver, card_index, index_card
+
+
+def brute_force(hands, leader, played, need, seat, adversarial):
+    """Plain minimax over every play; hands are sets of card indices"""
+    players = len(hands)
+    if len(played) == players:
+        winner = (leader + played.index(max(played))) % players
+        need -= winner == seat
+        if not any(hands):
+            return need == 0
+        return brute_force(hands, winner, [], need, seat, adversarial)
+
+    to_move = (leader + len(played)) % players
+    deciding = to_move == seat or not adversarial
+    for card in sorted(hands[to_move]):
+        hands[to_move].remove(card)
+        value = brute_force(hands, leader, played + [card], need, seat, adversarial)
+        hands[to_move].add(card)
+        if value == deciding:
+            return value
+    return not deciding
+
+
+def random_position(rng, players, cards_each, partial):
+    cards = rng.sample(range(40), players * cards_each)
+    hands = [cards[i * cards_each:(i + 1) * cards_each] for i in range(players)]
+    leader = rng.randrange(players)
+    played = []
+    if partial:
+        for offset in range(rng.randrange(players)):
+            hand = hands[(leader + offset) % players]
+            card = rng.choice(hand)
+            hand.remove(card)
+            played.append(card)
+    guesses = [rng.randint(0, cards_each) for _ in range(players)]
+    return hands, leader, played, guesses
+
+
+def to_position(hands, leader, played, guesses):
+    return EndgamePosition(
+        hands=[[index_card(c) for c in hand] for hand in hands],
+        leader=leader,
+        guesses=guesses,
+        turns_won=[0] * len(hands),
+        played=tuple(index_card(c) for c in played)
+    )
+
+
+class EndgameSolverTest(unittest.TestCase):
+    def check_against_brute_force(self, seed, shared_solver):
+        rng = random.Random(seed)
+        solver = EndgameSolver(time_limit=None)
+        for game in range(300):
+            players = rng.randint(2, 4)
+            hands, leader, played, guesses = random_position(rng, players, rng.randint(1, 3), game % 2 == 1)
+            position = to_position(hands, leader, played, guesses)
+            if not shared_solver:
+                solver = EndgameSolver(time_limit=None)
+
+            for seat in range(players):
+                for adversarial, check in ((True, solver.can_make_guess), (False, solver.can_reach_guess)):
+                    expected = brute_force([set(h) for h in hands], leader, list(played), guesses[seat],
+                                           seat, adversarial)
+                    self.assertEqual(check(position, seat), expected,
+                                     f"seed {seed} game {game} seat {seat} adversarial {adversarial}")
+
+    def test_matches_brute_force(self):
+        self.check_against_brute_force(1, shared_solver=False)
+
+    def test_matches_brute_force_with_shared_table(self):
+        self.check_against_brute_force(2, shared_solver=True)
+
+    def test_best_card_keeps_a_guess_that_can_be_made(self):
+        rng = random.Random(3)
+        solver = EndgameSolver(time_limit=None)
+        for game in range(100):
+            hands, leader, played, guesses = random_position(rng, 3, 3, True)
+            position = to_position(hands, leader, played, guesses)
+            seat = (leader + len(played)) % 3
+
+            results = solver.solve(position)
+            self.assertTrue(all(result['exact'] for result in results))
+            best_card = results[seat]['best_card']
+            self.assertIn(card_index(best_card), hands[seat])
+            self.assertEqual([r['seat'] for r in results if r['best_card'] is not None], [seat])
+
+            after = [list(hand) for hand in hands]
+            after[seat].remove(card_index(best_card))
+            child = to_position(after, leader, played + [card_index(best_card)], guesses)
+            if results[seat]['can_make_guess']:
+                self.assertTrue(solver.can_make_guess(child, seat))
+            if results[seat]['can_reach_guess']:
+                self.assertTrue(solver.can_reach_guess(child, seat))
+
+    def test_full_phase_is_always_answered(self):
+        rng = random.Random(4)
+        for game in range(5):
+            hands, leader, played, guesses = random_position(rng, 8, 5, game % 2 == 1)
+            results = EndgameSolver(time_limit=0.0).solve(to_position(hands, leader, played, guesses))
+            for result in results:
+                self.assertIsInstance(result['can_make_guess'], bool)
+                self.assertIsInstance(result['can_reach_guess'], bool)
+                if result['can_make_guess']:
+                    self.assertTrue(result['can_reach_guess'])
+
+
+if __name__ == '__main__':
+    unittest.main()
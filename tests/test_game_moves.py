@@ -0,0 +1,106 @@
+import copy
+import random
+import unittest
+from src.models.game import Game, GamePhase, Move
+
+
+def full_state(game):
+    """Everything apply and undo may touch, except the version counter"""
+    state = copy.deepcopy(game.to_dict())
+    state.pop('version')
+    return (
+        state,
+        [(p.player_id, p.lives, [repr(c) for c in p.hand], p.guess, p.turns_won, p.is_eliminated)
+         for p in game.players],
+        [repr(c) for c in game.deck.cards],
+        game.current_player_index,
+        game.current_guessing_player,
+        game.guessing_order_start,
+        copy.deepcopy(game.phase_history),
+        game.winner
+    )
+
+
+def new_game(rng, players=None):
+    game = Game('test')
+    for i in range(players or rng.randint(2, 8)):
+        game.add_player(f'p{i}', f'P{i}')
+    game.start_game()
+    return game
+
+
+class ApplyUndoTest(unittest.TestCase):
+    def test_undo_restores_every_state_of_random_games(self):
+        for seed in range(60):
+            rng = random.Random(seed)
+            game = new_game(rng)
+            history = []
+
+            while game.phase != GamePhase.GAME_OVER:
+                before = full_state(game)
+                version = game.version
+                move = rng.choice(game.legal_moves())
+                self.assertTrue(game.apply(move))
+                history.append(before)
+
+                if rng.random() < 0.3:
+                    self.assertEqual(game.undo(), move)
+                    self.assertEqual(full_state(game), before, f"seed {seed}")
+                    self.assertGreater(game.version, version)
+                    history.pop()
+
+            # Unwind the whole game back to the first deal
+            while history:
+                before = history.pop()
+                game.undo()
+                self.assertEqual(full_state(game), before, f"seed {seed}")
+            self.assertIsNone(game.undo())
+
+    def test_illegal_moves_are_rejected_without_changes(self):
+        rng = random.Random(1)
+        game = new_game(rng, players=4)
+        before = full_state(game)
+        guesser = game.legal_moves()[0].player_id
+
+        self.assertFalse(game.apply(Move(guesser)))
+        self.assertFalse(game.apply(Move('nobody', guess=0)))
+        self.assertFalse(game.apply(Move(guesser, guess=99)))
+        other = next(p.player_id for p in game.players if p.player_id != guesser)
+        self.assertFalse(game.apply(Move(other, guess=0)))
+        self.assertEqual(full_state(game), before)
+        self.assertIsNone(game.undo())
+
+    def test_clone_is_independent(self):
+        rng = random.Random(2)
+        game = new_game(rng, players=8)
+        for _ in range(10):
+            game.apply(rng.choice(game.legal_moves()))
+
+        clone = game.clone()
+        self.assertEqual(full_state(clone), full_state(game))
+        before = full_state(game)
+        while clone.phase != GamePhase.GAME_OVER:
+            clone.apply(rng.choice(clone.legal_moves()))
+        self.assertEqual(full_state(game), before)
+
+    def test_apply_all_applies_all_or_nothing(self):
+        rng = random.Random(3)
+        game = new_game(rng, players=5)
+        simulation = game.clone()
+        moves = []
+        for _ in range(8):
+            move = rng.choice(simulation.legal_moves())
+            simulation.apply(move)
+            moves.append(move)
+
+        before = full_state(game)
+        self.assertEqual(game.apply_all(moves[:5] + [Move('nobody', guess=0)] + moves[5:]), 5)
+        self.assertEqual(full_state(game), before)
+
+        self.assertIsNone(game.apply_all(moves))
+        self.assertEqual(full_state(game), full_state(simulation))
+        self.assertIsNone(game.undo())  # Applied batches leave no undo records
+
+
+if __name__ == '__main__':
+    unittest.main()